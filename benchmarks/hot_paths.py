@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the hot paths of the clifin repository.
+
+For each database size, seeds a fresh temporary database with the
+reproducible generator of seed_db.py and measures insert throughput,
+`list` (first page, with and without filters), `summary`, a date range
+query, the dashboard frame load, exports to Parquet and Arrow, and
+single-row creates with and without the write-behind writer. Each
+size runs in its own process, so caches and pools start cold.
+
+Results are printed as a table and can be written as JSON (--output) and
+compared against a previous run (--compare): the run fails if a benchmark
+got slower than the baseline by more than --tolerance.
+
+Usage: python benchmarks/hot_paths.py [--rows 1e4 1e5] [--repeat 5]
+           [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Fixed so every run generates the same rows
+SEED = 42
+END_DATE = date(2025, 12, 31)
+DAYS = 3 * 365
+
+DEFAULT_ROWS = [10_000, 100_000]
+
+# Rows inserted one `create` call (and commit) at a time
+CREATE_LOOP_ROWS = 1000
+
+# Slowdowns smaller than this are timer noise, even above --tolerance
+MIN_REGRESSION_S = 0.001
+
+
+def run_benchmarks(rows: int, repeat: int, tmp: Path) -> list[dict]:
+    """Seed the database at CLIFIN_DB_PATH and time every hot path.
+
+    Runs in the worker process: CLIFIN_DB_PATH must be set before clifin
+    is imported.
+    """
+    sys.path.insert(0, str(ROOT))
+
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(str(ROOT / "alembic.ini")), "head")
+
+    from seed_db import generate_columns, iter_transactions
+    from src.clifin.exporters import write_transactions
+    from src.clifin.models.transaction import TransactionFilter
+    from src.clifin.repositories.transaction_repository import (
+        TransactionRepository,
+    )
+
+    repo = TransactionRepository()
+    results = []
+
+    def record(name: str, timings: list[float], processed: int) -> None:
+        best = min(timings)
+        results.append(
+            {
+                "benchmark": name,
+                "rows": rows,
+                "runs": len(timings),
+                "best_s": best,
+                "median_s": statistics.median(timings),
+                "processed": processed,
+                "rows_per_s": processed / best if best > 0 else None,
+            }
+        )
+
+    def measure(name: str, call: Callable[[], int]) -> None:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            processed = call()
+            timings.append(time.perf_counter() - start)
+        record(name, timings, processed)
+
+    start = time.perf_counter()
+    columns = generate_columns(rows, SEED, DAYS, END_DATE)
+    record("generate", [time.perf_counter() - start], rows)
+
+    # Inserting is only measured once: every run would grow the database
+    start = time.perf_counter()
+    inserted = repo.create_many(iter_transactions(columns))
+    record("insert", [time.perf_counter() - start], inserted)
+
+    def export(name: str) -> int:
+        path = tmp / name
+        try:
+            return write_transactions(repo.iter_arrays(), path)
+        finally:
+            path.unlink(missing_ok=True)
+
+    def summary() -> int:
+        # Same queries as `clifin summary`
+        repo.get_total_balance()
+        return len(repo.get_balance_by_category())
+
+    filters = TransactionFilter(categories=["Food"], min_amount=50, sign=-1)
+    measure("list", lambda: len(repo.get_page(20)))
+    measure("list_filtered", lambda: len(repo.get_page(20, filters=filters)))
+    measure("summary", summary)
+    measure(
+        "range_month",
+        lambda: len(repo.get_transactions_by_date_range("2025-06-01", "2025-06-30")),
+    )
+    measure("frame", lambda: len(repo.fetch_frame()))
+    measure("export_parquet", lambda: export("export.parquet"))
+    measure("export_arrow", lambda: export("export.arrow"))
+
+    # Run last, and once, since both grow the database: one commit per
+    # `create` against group commits of the write-behind writer
+    start = time.perf_counter()
+    created = 0
+    for transaction in islice(iter_transactions(columns), CREATE_LOOP_ROWS):
+        repo.create(transaction)
+        created += 1
+    record("create_loop", [time.perf_counter() - start], created)
+
+    start = time.perf_counter()
+    with repo.buffered_writer() as writer:
+        for transaction in iter_transactions(columns):
+            writer.add(transaction)
+    record("create_buffered", [time.perf_counter() - start], writer.written)
+    return results
+
+
+def run_worker(rows: int, repeat: int) -> list[dict]:
+    """Run the benchmarks of one database size in a fresh process."""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["CLIFIN_DB_PATH"] = str(Path(tmp) / "bench.db")
+        result = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--worker",
+                "--rows",
+                str(rows),
+                "--repeat",
+                str(repeat),
+            ],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise RuntimeError(f"Benchmarks with {rows} rows failed")
+    # Migrations log to stderr, so stdout only holds the results
+    return json.loads(result.stdout)
+
+
+def metadata() -> dict:
+    """Describe the environment the results were measured in."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def print_table(results: list[dict]) -> None:
+    print(f"{'benchmark':<16} {'rows':>10} {'best':>10} {'median':>10} {'rows/s':>12}")
+    for result in results:
+        rate = result["rows_per_s"]
+        print(
+            f"{result['benchmark']:<16} {result['rows']:>10} "
+            f"{result['best_s'] * 1000:>8.1f}ms {result['median_s'] * 1000:>8.1f}ms "
+            f"{f'{rate:,.0f}' if rate else '-':>12}"
+        )
+
+
+def regressions(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """List the benchmarks slower than in the baseline by more than tolerance."""
+    previous = {(r["benchmark"], r["rows"]): r for r in baseline["results"]}
+    problems = []
+    for result in results:
+        before = previous.get((result["benchmark"], result["rows"]))
+        if before is None or before["best_s"] <= 0:
+            continue
+        change = result["best_s"] / before["best_s"] - 1
+        slower = result["best_s"] - before["best_s"]
+        if change > tolerance and slower > MIN_REGRESSION_S:
+            problems.append(
+                f"{result['benchmark']} ({result['rows']} rows): "
+                f"{before['best_s'] * 1000:.1f}ms -> {result['best_s'] * 1000:.1f}ms "
+                f"(+{change:.0%})"
+            )
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--rows",
+        type=lambda value: int(float(value)),
+        nargs="+",
+        default=DEFAULT_ROWS,
+        help="Database sizes, e.g. 1e4 1e5 1e6",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare to")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against the baseline (0.25 = 25%%)",
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = run_benchmarks(args.rows[0], args.repeat, Path(tmp))
+        print(json.dumps(results))
+        return 0
+
+    results = []
+    for rows in args.rows:
+        results.extend(run_worker(rows, args.repeat))
+    print_table(results)
+
+    if args.output:
+        report = {"meta": metadata(), "results": results}
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare:
+        problems = regressions(
+            results, json.loads(args.compare.read_text()), args.tolerance
+        )
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            return 1
+        print(
+            f"✅ No benchmark slower than the baseline by more than {args.tolerance:.0%}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Check that TransactionRepository queries are served by indexes.
+
+Migrates a temporary database, calls each repository read method while
+tracing the SQL it runs, and inspects every statement with
+EXPLAIN QUERY PLAN. Exits with status 1 if an expected index does not
+exist, or a query scans the transactions table without an index, misses
+its expected index, or sorts rows that the index should already return
+in order.
+
+Imports the installed clifin package, e.g. through uv.
+
+Usage: uv run python benchmarks/query_plans.py
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+# Safe before CLIFIN_DB_PATH is set: neither the package entry point nor
+# the models import the database module
+from clifin.models.transaction import TransactionFilter
+
+ROOT = Path(__file__).parent.parent
+
+
+@dataclass
+class PlanCheck:
+    """Expected query plan for one repository call."""
+
+    name: str
+    call: Callable  # Receives a TransactionRepository
+    index: str  # Text that must appear in the plan
+    sorted_by_index: bool = False  # Fail on "USE TEMP B-TREE FOR ORDER BY"
+
+
+CHECKS = [
+    PlanCheck("get_by_id", lambda r: r.get_by_id(1), "INTEGER PRIMARY KEY"),
+    PlanCheck(
+        "get_all",
+        lambda r: r.get_all(),
+        "ix_transactions_day_created_at",
+        sorted_by_index=True,
+    ),
+    PlanCheck(
+        "get_transactions_by_date_range",
+        lambda r: r.get_transactions_by_date_range("2025-01-01", "2025-01-31"),
+        "ix_transactions_day_created_at",
+        sorted_by_index=True,
+    ),
+    PlanCheck(
+        "iter_range",
+        lambda r: list(r.iter_range("2025-01-01", "2025-01-31")),
+        "ix_transactions_day_created_at",
+        sorted_by_index=True,
+    ),
+    PlanCheck(
+        "get_page",
+        lambda r: r.get_page(20, offset=20),
+        "ix_transactions_day_created_at",
+        sorted_by_index=True,
+    ),
+    PlanCheck(
+        "get_page (keyset)",
+        lambda r: r.get_page(20, after_id=1, before_date="2025-01-31"),
+        "ix_transactions_day_created_at",
+        sorted_by_index=True,
+    ),
+    PlanCheck(
+        "get_page (date filters)",
+        lambda r: r.get_page(
+            20,
+            filters=TransactionFilter(
+                "2025-01-01", "2025-01-31", min_amount=10, sign=-1
+            ),
+        ),
+        "ix_transactions_day_created_at",
+        sorted_by_index=True,
+    ),
+    PlanCheck(
+        "get_page (text filter)",
+        lambda r: r.get_page(20, filters=TransactionFilter(text="uber")),
+        "SCAN transactions_fts VIRTUAL TABLE INDEX",
+    ),
+    PlanCheck(
+        "get_page (category filters)",
+        lambda r: r.get_page(
+            20, filters=TransactionFilter(categories=["Food"], min_amount=10)
+        ),
+        "ix_transactions_category_id_amount_cents",
+    ),
+    PlanCheck(
+        "search",
+        lambda r: r.search("uber"),
+        "SCAN transactions_fts VIRTUAL TABLE INDEX",
+    ),
+    PlanCheck(
+        "get_total_balance",
+        lambda r: r.get_total_balance(),
+        "SCAN transaction_rollups",
+    ),
+    PlanCheck(
+        "get_balance_by_category",
+        lambda r: r.get_balance_by_category(),
+        "SCAN transaction_rollups",
+    ),
+    PlanCheck(
+        "get_balance_by_month",
+        lambda r: r.get_balance_by_month(),
+        "SCAN transaction_rollups",
+    ),
+]
+
+
+def explain(conn: sqlite3.Connection, sql: str) -> list[str]:
+    """Get the EXPLAIN QUERY PLAN detail lines for a statement."""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+def problems_for(
+    check: PlanCheck, plans: list[list[str]], indexes: set[str]
+) -> list[str]:
+    """Compare the plans of a repository call against its expectations."""
+    problems = []
+    if check.index.startswith("ix_") and check.index not in indexes:
+        problems.append(f"index {check.index} does not exist (migration missing?)")
+    if not plans:
+        return [*problems, "no SELECT statement was executed"]
+
+    details = [detail for plan in plans for detail in plan]
+    for detail in details:
+        if detail.startswith("SCAN transactions") and "INDEX" not in detail:
+            problems.append(f"full table scan: {detail}")
+        if check.sorted_by_index and detail == "USE TEMP B-TREE FOR ORDER BY":
+            problems.append("rows are sorted instead of read in index order")
+    if not any(check.index in detail for detail in details):
+        problems.append(f"expected plan to use {check.index}")
+    return problems
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "query_plans.db"
+        # Must be set before clifin is imported
+        os.environ["CLIFIN_DB_PATH"] = str(db_path)
+
+        from alembic import command
+        from alembic.config import Config
+
+        command.upgrade(Config(str(ROOT / "alembic.ini")), "head")
+
+        # Category filters are resolved to ids first, and a filter on an
+        # unknown category never reaches the transactions index. Keyset
+        # pages need an existing transaction as their cursor.
+        seed = sqlite3.connect(db_path)
+        seed.execute("INSERT INTO categories (name) VALUES ('Food')")
+        seed.execute(
+            "INSERT INTO transactions (title, amount_cents, category_id, day) "
+            "SELECT 'Lunch', -1500, id, 20089 FROM categories WHERE name = 'Food'"
+        )
+        seed.commit()
+        seed.close()
+
+        from clifin.db.database import configure_pool
+        from clifin.repositories.transaction_repository import TransactionRepository
+
+        # A single pooled connection guarantees every call is traced
+        statements: list[str] = []
+        pool = configure_pool(1)
+        traced = pool.acquire()
+        traced.set_trace_callback(statements.append)
+        pool.release(traced)
+
+        repo = TransactionRepository()
+        explain_conn = sqlite3.connect(db_path)
+        indexes = {
+            name
+            for (name,) in explain_conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        failed = 0
+
+        for check in CHECKS:
+            statements.clear()
+            check.call(repo)
+            plans = [
+                explain(explain_conn, sql)
+                for sql in statements
+                if sql.lstrip().upper().startswith("SELECT")
+            ]
+
+            problems = problems_for(check, plans, indexes)
+            if problems:
+                failed += 1
+                print(f"❌ {check.name}")
+                for problem in problems:
+                    print(f"   - {problem}")
+            else:
+                # Show the statement using the index, not e.g. a category
+                # lookup or an FTS5 internal query run before it
+                plan = next(
+                    plan for plan in plans if any(check.index in d for d in plan)
+                )
+                print(f"✅ {check.name}: {' | '.join(plan)}")
+
+        explain_conn.close()
+        pool.close()
+
+    if failed:
+        print(f"{failed} of {len(CHECKS)} query plan checks failed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of transaction row decoding.
+
+Compares the original decode path (sqlite3.Row + Transaction.from_row on a
+dict-backed dataclass) against the current one (positional
+Transaction.row_factory on the slotted Transaction). Reports per-row decode
+cost, total bytes allocated per row (object plus its field values) and the
+size of the object itself.
+
+Usage: python benchmarks/row_decode.py [--rows 200000]
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.clifin.models.transaction import TRANSACTION_COLUMNS, Transaction  # noqa: E402
+
+
+@dataclass
+class DictTransaction:
+    """Transaction as it was before slots were added (baseline)."""
+
+    id: int | None
+    title: str
+    amount: float
+    category: str
+    date: str
+    description: str | None = None
+    created_at: str | None = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "DictTransaction":
+        return cls(
+            id=row["id"],
+            title=row["title"],
+            amount=row["amount"],
+            category=row["category"],
+            date=row["date"],
+            description=row["description"],
+            created_at=row["created_at"],
+        )
+
+
+def build_database(rows: int) -> sqlite3.Connection:
+    """Create an in-memory transactions table with `rows` rows."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        """
+        CREATE TABLE transactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title VARCHAR NOT NULL,
+            amount_cents INTEGER NOT NULL,
+            category VARCHAR NOT NULL,
+            description VARCHAR,
+            date VARCHAR NOT NULL,
+            created_at VARCHAR DEFAULT (CURRENT_TIMESTAMP) NOT NULL
+        )
+        """
+    )
+    conn.executemany(
+        "INSERT INTO transactions (title, amount_cents, category, description, date) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (
+            (
+                f"Item {i}",
+                -1250 - i % 100 * 100,
+                "Food",
+                None,
+                f"2025-{1 + i % 12:02d}-01",
+            )
+            for i in range(rows)
+        ),
+    )
+    conn.commit()
+    return conn
+
+
+def decode_before(conn: sqlite3.Connection) -> list[DictTransaction]:
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute("SELECT *, amount_cents / 100.0 AS amount FROM transactions")
+    return [DictTransaction.from_row(row) for row in cursor.fetchall()]
+
+
+def decode_after(conn: sqlite3.Connection) -> list[Transaction]:
+    cursor = conn.cursor()
+    cursor.row_factory = Transaction.row_factory
+    columns = (
+        "amount_cents / 100.0 AS amount" if column == "amount" else column
+        for column in TRANSACTION_COLUMNS
+    )
+    cursor.execute(f"SELECT {', '.join(columns)} FROM transactions")
+    return cursor.fetchall()
+
+
+def instance_size(obj: object) -> int:
+    """Size of the object itself, including its __dict__ if it has one."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure(decode, conn: sqlite3.Connection, rows: int) -> tuple[float, float, int]:
+    """Return best ns/row over 3 runs, bytes allocated per row and instance size."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        decode(conn)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    objects = decode(conn)
+    allocated, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = instance_size(objects[0])
+    del objects
+
+    return best / rows * 1e9, allocated / rows, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    conn = build_database(args.rows)
+    print(f"Decoding {args.rows} rows\n")
+    print(f"{'Path':<32} {'ns/row':>10} {'bytes/row':>10} {'instance':>10}")
+    print("-" * 65)
+    for name, decode in (
+        ("before: Row + from_row, dict", decode_before),
+        ("after: row_factory, slots", decode_after),
+    ):
+        ns_per_row, bytes_per_row, size = measure(decode, conn, args.rows)
+        print(f"{name:<32} {ns_per_row:>10.0f} {bytes_per_row:>10.0f} {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark and budget check for the clifin CLI.
+
+Measures, in fresh interpreter processes:
+- the cumulative `import clifin.cli` time reported by `python -X importtime`
+  (`import clifin` alone only loads the entry point shim)
+- the wall time of `clifin add` and `clifin list` against a temporary database
+
+and verifies that heavy analytics/migration packages are not imported at
+startup. Exits with status 1 if a budget is exceeded.
+
+Usage: python benchmarks/startup.py [--runs 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Budgets in milliseconds (best of --runs, measured on a developer laptop)
+IMPORT_BUDGET_MS = 80
+COMMAND_BUDGETS_MS = {
+    "add": 250,
+    "list": 250,
+}
+
+# Packages that must only be imported by the commands that use them
+FORBIDDEN_AT_STARTUP = (
+    "alembic",
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "sqlalchemy",
+    "streamlit",
+)
+
+COMMANDS = {
+    "add": ["add", "Coffee", "5", "Food", "--date", "2025-01-01"],
+    "list": ["list", "--limit", "20"],
+}
+
+
+def python_env(db_path: Path) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(ROOT / "src")
+    env["CLIFIN_DB_PATH"] = str(db_path)
+    # Measure direct mode even if a `clifin serve` is running
+    env["CLIFIN_DIRECT"] = "1"
+    return env
+
+
+def measure_import(env: dict[str, str], runs: int) -> tuple[float, set[str]]:
+    """Return the best `import clifin.cli` time (ms) and the modules it imported."""
+    best = float("inf")
+    modules: set[str] = set()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import clifin.cli"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _self, cumulative, name = line.split("|")
+            name = name.strip()
+            modules.add(name.split(".")[0])
+            if name == "clifin.cli":
+                best = min(best, int(cumulative) / 1000)
+    return best, modules
+
+
+def measure_command(args: list[str], env: dict[str, str], runs: int) -> float:
+    """Return the best wall time (ms) of a CLI command in a fresh process."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", "import clifin; clifin.main()", *args],
+            env=env,
+            capture_output=True,
+            check=True,
+        )
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def report(name: str, measured: float, budget: float) -> bool:
+    within = measured <= budget
+    status = "✅" if within else "❌"
+    print(f"{status} {name:<16} {measured:>8.1f} ms   (budget {budget} ms)")
+    return within
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = python_env(Path(tmp) / "startup.db")
+        subprocess.run(
+            [sys.executable, "-m", "alembic", "upgrade", "head"],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            check=True,
+        )
+
+        ok = True
+        import_ms, modules = measure_import(env, args.runs)
+        ok &= report("import clifin.cli", import_ms, IMPORT_BUDGET_MS)
+        for name, command in COMMANDS.items():
+            measured = measure_command(command, env, args.runs)
+            ok &= report(f"clifin {name}", measured, COMMAND_BUDGETS_MS[name])
+
+    leaked = sorted(modules.intersection(FORBIDDEN_AT_STARTUP))
+    if leaked:
+        ok = False
+        print(f"❌ imported at startup: {', '.join(leaked)}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -9,6 +10,10 @@ from alembic import context
 # access to the values within the .ini file in use.
 config = context.config
 
+# Use the same database file as the application when CLIFIN_DB_PATH is set
+if db_path := os.environ.get("CLIFIN_DB_PATH"):
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
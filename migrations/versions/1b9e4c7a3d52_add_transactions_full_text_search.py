@@ -0,0 +1,85 @@
+"""add transactions full text search
+
+Revision ID: 1b9e4c7a3d52
+Revises: f2a7d5c3e816
+Create Date: 2026-10-18 01:26:12.330418
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1b9e4c7a3d52"
+down_revision: Union[str, Sequence[str], None] = "f2a7d5c3e816"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # External content table: the index stores only tokens and reads the
+    # text back from transactions. Diacritics are folded so "salario"
+    # matches "Salário", and 2-3 character prefixes are indexed so prefix
+    # queries stay index lookups.
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE transactions_fts USING fts5(
+            title,
+            description,
+            content='transactions',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        """
+    )
+    # Rank title matches above description matches
+    op.execute(
+        "INSERT INTO transactions_fts (transactions_fts, rank) "
+        "VALUES ('rank', 'bm25(10.0, 1.0)')"
+    )
+    op.execute("INSERT INTO transactions_fts (transactions_fts) VALUES ('rebuild')")
+
+    # External content tables are not updated automatically. Deletes must
+    # pass the old values so their tokens can be removed from the index.
+    op.execute(
+        """
+        CREATE TRIGGER transactions_fts_insert AFTER INSERT ON transactions
+        BEGIN
+            INSERT INTO transactions_fts (rowid, title, description)
+            VALUES (NEW.id, NEW.title, NEW.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER transactions_fts_delete AFTER DELETE ON transactions
+        BEGIN
+            INSERT INTO transactions_fts (transactions_fts, rowid, title, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER transactions_fts_update
+        AFTER UPDATE OF title, description ON transactions
+        BEGIN
+            INSERT INTO transactions_fts (transactions_fts, rowid, title, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.description);
+            INSERT INTO transactions_fts (rowid, title, description)
+            VALUES (NEW.id, NEW.title, NEW.description);
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER transactions_fts_update")
+    op.execute("DROP TRIGGER transactions_fts_delete")
+    op.execute("DROP TRIGGER transactions_fts_insert")
+    op.execute("DROP TABLE transactions_fts")
@@ -0,0 +1,38 @@
+"""add transactions indexes
+
+Revision ID: 9c41e7a2b5d3
+Revises: 2743c1ff4cdc
+Create Date: 2026-10-17 21:05:12.418203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c41e7a2b5d3"
+down_revision: Union[str, Sequence[str], None] = "2743c1ff4cdc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves ORDER BY date DESC, created_at DESC (scanned backwards)
+    # and date BETWEEN ? AND ? range searches without a sort step
+    op.create_index(
+        "ix_transactions_date_created_at", "transactions", ["date", "created_at"]
+    )
+    # Covers GROUP BY category with SUM(amount) and SUM(amount) over the
+    # whole table without reading the full rows
+    op.create_index(
+        "ix_transactions_category_amount", "transactions", ["category", "amount"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_category_amount", table_name="transactions")
+    op.drop_index("ix_transactions_date_created_at", table_name="transactions")
@@ -0,0 +1,165 @@
+"""store amounts as integer cents
+
+Revision ID: a5f2c8e1b94d
+Revises: e7a14c9d2f60
+Create Date: 2026-10-17 21:52:48.130964
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5f2c8e1b94d"
+down_revision: Union[str, Sequence[str], None] = "e7a14c9d2f60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Triggers attached to transactions. SQLite drops them along with the table
+# when batch mode rebuilds it, so they are recreated for the new columns.
+TRIGGERS = (
+    "transactions_rollup_insert",
+    "transactions_rollup_delete",
+    "transactions_rollup_update",
+    "transactions_count_update",
+    "transactions_count_delete",
+)
+
+
+def _create_triggers(amount: str, total: str) -> None:
+    """Create the rollup and change counter triggers.
+
+    Args:
+        amount: Amount column of transactions
+        total: Total column of transaction_rollups
+    """
+
+    def key(row: str) -> str:
+        return (
+            f"substr({row}.date, 1, 7), {row}.category, "
+            f"CASE WHEN {row}.{amount} < 0 THEN -1 ELSE 1 END"
+        )
+
+    def add(row: str) -> str:
+        return f"""
+            INSERT INTO transaction_rollups (month, category, sign, {total}, count)
+            VALUES ({key(row)}, {row}.{amount}, 1)
+            ON CONFLICT (month, category, sign) DO UPDATE
+            SET {total} = {total} + excluded.{total}, count = count + 1;
+        """
+
+    def remove(row: str) -> str:
+        return f"""
+            UPDATE transaction_rollups
+            SET {total} = {total} - {row}.{amount}, count = count - 1
+            WHERE (month, category, sign) = ({key(row)});
+            DELETE FROM transaction_rollups
+            WHERE (month, category, sign) = ({key(row)}) AND count = 0;
+        """
+
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_insert AFTER INSERT ON transactions
+        BEGIN {add("NEW")} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_delete AFTER DELETE ON transactions
+        BEGIN {remove("OLD")} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_update
+        AFTER UPDATE OF {amount}, category, date ON transactions
+        BEGIN {remove("OLD")} {add("NEW")} END
+        """
+    )
+    for event in ("UPDATE", "DELETE"):
+        op.execute(
+            f"""
+            CREATE TRIGGER transactions_count_{event.lower()}
+            AFTER {event} ON transactions
+            BEGIN
+                UPDATE change_counters SET value = value + 1
+                WHERE name = 'transaction_edits';
+            END
+            """
+        )
+
+
+def _recreate_rollups(amount: str, total: str, total_type: sa.types.TypeEngine) -> None:
+    """Recreate transaction_rollups with the given total column and backfill it."""
+    op.drop_table("transaction_rollups")
+    op.create_table(
+        "transaction_rollups",
+        sa.Column("month", sa.String(), nullable=False),  # YYYY-MM
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("sign", sa.Integer(), nullable=False),
+        sa.Column(total, total_type, nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("month", "category", "sign"),
+        sqlite_with_rowid=False,
+    )
+    op.execute(
+        f"""
+        INSERT INTO transaction_rollups (month, category, sign, {total}, count)
+        SELECT
+            substr(date, 1, 7),
+            category,
+            CASE WHEN {amount} < 0 THEN -1 ELSE 1 END,
+            SUM({amount}),
+            COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER {trigger}")
+    op.drop_index("ix_transactions_category_amount", table_name="transactions")
+
+    op.add_column(
+        "transactions", sa.Column("amount_cents", sa.Integer(), nullable=True)
+    )
+    op.execute(
+        "UPDATE transactions SET amount_cents = CAST(ROUND(amount * 100) AS INTEGER)"
+    )
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("amount_cents", nullable=False)
+        batch_op.drop_column("amount")
+
+    op.create_index(
+        "ix_transactions_category_amount_cents",
+        "transactions",
+        ["category", "amount_cents"],
+    )
+    _recreate_rollups("amount_cents", "total_cents", sa.Integer())
+    _create_triggers("amount_cents", "total_cents")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER {trigger}")
+    op.drop_index("ix_transactions_category_amount_cents", table_name="transactions")
+
+    op.add_column("transactions", sa.Column("amount", sa.Float(), nullable=True))
+    op.execute("UPDATE transactions SET amount = amount_cents / 100.0")
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("amount", nullable=False)
+        batch_op.drop_column("amount_cents")
+
+    op.create_index(
+        "ix_transactions_category_amount", "transactions", ["category", "amount"]
+    )
+    _recreate_rollups("amount", "total", sa.Float())
+    _create_triggers("amount", "total")
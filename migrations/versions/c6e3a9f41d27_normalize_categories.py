@@ -0,0 +1,212 @@
+"""normalize categories
+
+Revision ID: c6e3a9f41d27
+Revises: a5f2c8e1b94d
+Create Date: 2026-10-17 23:14:05.482317
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e3a9f41d27"
+down_revision: Union[str, Sequence[str], None] = "a5f2c8e1b94d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Triggers attached to transactions. SQLite drops them along with the table
+# when batch mode rebuilds it, so they are recreated for the new columns.
+TRIGGERS = (
+    "transactions_rollup_insert",
+    "transactions_rollup_delete",
+    "transactions_rollup_update",
+    "transactions_count_update",
+    "transactions_count_delete",
+)
+
+
+def _create_triggers(category: str) -> None:
+    """Create the rollup and change counter triggers of transactions.
+
+    Args:
+        category: Category column of transactions and transaction_rollups
+    """
+
+    def key(row: str) -> str:
+        return (
+            f"substr({row}.date, 1, 7), {row}.{category}, "
+            f"CASE WHEN {row}.amount_cents < 0 THEN -1 ELSE 1 END"
+        )
+
+    def add(row: str) -> str:
+        return f"""
+            INSERT INTO transaction_rollups
+                (month, {category}, sign, total_cents, count)
+            VALUES ({key(row)}, {row}.amount_cents, 1)
+            ON CONFLICT (month, {category}, sign) DO UPDATE
+            SET total_cents = total_cents + excluded.total_cents, count = count + 1;
+        """
+
+    def remove(row: str) -> str:
+        return f"""
+            UPDATE transaction_rollups
+            SET total_cents = total_cents - {row}.amount_cents, count = count - 1
+            WHERE (month, {category}, sign) = ({key(row)});
+            DELETE FROM transaction_rollups
+            WHERE (month, {category}, sign) = ({key(row)}) AND count = 0;
+        """
+
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_insert AFTER INSERT ON transactions
+        BEGIN {add("NEW")} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_delete AFTER DELETE ON transactions
+        BEGIN {remove("OLD")} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_update
+        AFTER UPDATE OF amount_cents, {category}, date ON transactions
+        BEGIN {remove("OLD")} {add("NEW")} END
+        """
+    )
+    for event in ("UPDATE", "DELETE"):
+        op.execute(
+            f"""
+            CREATE TRIGGER transactions_count_{event.lower()}
+            AFTER {event} ON transactions
+            BEGIN
+                UPDATE change_counters SET value = value + 1
+                WHERE name = 'transaction_edits';
+            END
+            """
+        )
+
+
+def _recreate_rollups(category: str, category_type: sa.types.TypeEngine) -> None:
+    """Recreate transaction_rollups keyed on the given column and backfill it."""
+    op.drop_table("transaction_rollups")
+    op.create_table(
+        "transaction_rollups",
+        sa.Column("month", sa.String(), nullable=False),  # YYYY-MM
+        sa.Column(category, category_type, nullable=False),
+        sa.Column("sign", sa.Integer(), nullable=False),
+        sa.Column("total_cents", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("month", category, "sign"),
+        sqlite_with_rowid=False,
+    )
+    op.execute(
+        f"""
+        INSERT INTO transaction_rollups (month, {category}, sign, total_cents, count)
+        SELECT
+            substr(date, 1, 7),
+            {category},
+            CASE WHEN amount_cents < 0 THEN -1 ELSE 1 END,
+            SUM(amount_cents),
+            COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER {trigger}")
+    op.drop_index("ix_transactions_category_amount_cents", table_name="transactions")
+
+    op.create_table(
+        "categories",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_categories_name", "categories", ["name"], unique=True)
+    op.execute(
+        "INSERT INTO categories (name) "
+        "SELECT DISTINCT category FROM transactions ORDER BY category"
+    )
+
+    op.add_column("transactions", sa.Column("category_id", sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE transactions
+        SET category_id = (SELECT id FROM categories WHERE name = category)
+        """
+    )
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("category_id", nullable=False)
+        batch_op.create_foreign_key(
+            "fk_transactions_category_id", "categories", ["category_id"], ["id"]
+        )
+        batch_op.drop_column("category")
+
+    op.create_index(
+        "ix_transactions_category_id_amount_cents",
+        "transactions",
+        ["category_id", "amount_cents"],
+    )
+    _recreate_rollups("category_id", sa.Integer())
+    _create_triggers("category_id")
+
+    # Renaming or merging a category changes how its transactions read, so
+    # it counts as an edit for caches keyed on the ChangeToken. The
+    # category_edits counter lets name -> id caches detect stale entries.
+    op.execute("INSERT INTO change_counters (name, value) VALUES ('category_edits', 0)")
+    for event in ("UPDATE", "DELETE"):
+        op.execute(
+            f"""
+            CREATE TRIGGER categories_count_{event.lower()}
+            AFTER {event} ON categories
+            BEGIN
+                UPDATE change_counters SET value = value + 1
+                WHERE name IN ('transaction_edits', 'category_edits');
+            END
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER categories_count_delete")
+    op.execute("DROP TRIGGER categories_count_update")
+    op.execute("DELETE FROM change_counters WHERE name = 'category_edits'")
+
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER {trigger}")
+    op.drop_index("ix_transactions_category_id_amount_cents", table_name="transactions")
+
+    op.add_column("transactions", sa.Column("category", sa.String(), nullable=True))
+    op.execute(
+        """
+        UPDATE transactions
+        SET category = (SELECT name FROM categories WHERE id = category_id)
+        """
+    )
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("category", nullable=False)
+        batch_op.drop_constraint("fk_transactions_category_id", type_="foreignkey")
+        batch_op.drop_column("category_id")
+
+    op.create_index(
+        "ix_transactions_category_amount_cents",
+        "transactions",
+        ["category", "amount_cents"],
+    )
+    _recreate_rollups("category", sa.String())
+    _create_triggers("category")
+
+    op.drop_index("ix_categories_name", table_name="categories")
+    op.drop_table("categories")
@@ -0,0 +1,105 @@
+"""create transaction rollups
+
+Revision ID: d3b8f1a6c2e4
+Revises: 9c41e7a2b5d3
+Create Date: 2026-10-17 21:14:37.902115
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3b8f1a6c2e4"
+down_revision: Union[str, Sequence[str], None] = "9c41e7a2b5d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Rollup key of a transaction row: (month, category, sign)
+# sign is 1 for revenues and -1 for expenses
+def _key(row: str) -> str:
+    return (
+        f"substr({row}.date, 1, 7), {row}.category, "
+        f"CASE WHEN {row}.amount < 0 THEN -1 ELSE 1 END"
+    )
+
+
+def _add(row: str) -> str:
+    return f"""
+        INSERT INTO transaction_rollups (month, category, sign, total, count)
+        VALUES ({_key(row)}, {row}.amount, 1)
+        ON CONFLICT (month, category, sign) DO UPDATE
+        SET total = total + excluded.total, count = count + 1;
+    """
+
+
+def _remove(row: str) -> str:
+    return f"""
+        UPDATE transaction_rollups
+        SET total = total - {row}.amount, count = count - 1
+        WHERE (month, category, sign) = ({_key(row)});
+        DELETE FROM transaction_rollups
+        WHERE (month, category, sign) = ({_key(row)}) AND count = 0;
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "transaction_rollups",
+        sa.Column("month", sa.String(), nullable=False),  # YYYY-MM
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("sign", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Float(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("month", "category", "sign"),
+        sqlite_with_rowid=False,
+    )
+
+    # Backfill from existing transactions
+    op.execute(
+        """
+        INSERT INTO transaction_rollups (month, category, sign, total, count)
+        SELECT
+            substr(date, 1, 7),
+            category,
+            CASE WHEN amount < 0 THEN -1 ELSE 1 END,
+            SUM(amount),
+            COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3
+        """
+    )
+
+    # Keep rollups in sync with every write, whichever code path makes it
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_insert AFTER INSERT ON transactions
+        BEGIN {_add("NEW")} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_delete AFTER DELETE ON transactions
+        BEGIN {_remove("OLD")} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_update
+        AFTER UPDATE OF amount, category, date ON transactions
+        BEGIN {_remove("OLD")} {_add("NEW")} END
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER transactions_rollup_update")
+    op.execute("DROP TRIGGER transactions_rollup_delete")
+    op.execute("DROP TRIGGER transactions_rollup_insert")
+    op.drop_table("transaction_rollups")
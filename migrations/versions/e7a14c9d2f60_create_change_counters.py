@@ -0,0 +1,52 @@
+"""create change counters
+
+Revision ID: e7a14c9d2f60
+Revises: d3b8f1a6c2e4
+Create Date: 2026-10-17 21:31:02.557310
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a14c9d2f60"
+down_revision: Union[str, Sequence[str], None] = "d3b8f1a6c2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "change_counters",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("value", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "INSERT INTO change_counters (name, value) VALUES ('transaction_edits', 0)"
+    )
+
+    # Counts updates and deletes only: inserts are detected through MAX(id),
+    # so caches can tell pure appends apart from edits of existing rows
+    for event in ("UPDATE", "DELETE"):
+        op.execute(
+            f"""
+            CREATE TRIGGER transactions_count_{event.lower()}
+            AFTER {event} ON transactions
+            BEGIN
+                UPDATE change_counters SET value = value + 1
+                WHERE name = 'transaction_edits';
+            END
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER transactions_count_delete")
+    op.execute("DROP TRIGGER transactions_count_update")
+    op.drop_table("change_counters")
@@ -0,0 +1,165 @@
+"""store dates as day numbers
+
+Revision ID: f2a7d5c3e816
+Revises: c6e3a9f41d27
+Create Date: 2026-10-18 00:41:27.903512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a7d5c3e816"
+down_revision: Union[str, Sequence[str], None] = "c6e3a9f41d27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Triggers attached to transactions. SQLite drops them along with the table
+# when batch mode rebuilds it, so they are recreated for the new columns.
+TRIGGERS = (
+    "transactions_rollup_insert",
+    "transactions_rollup_delete",
+    "transactions_rollup_update",
+    "transactions_count_update",
+    "transactions_count_delete",
+)
+
+# Julian day of 1970-01-01, the epoch of the day numbers
+UNIX_EPOCH_JULIAN_DAY = 2440587.5
+
+# Read-only text view of the day number, so SQL reading transactions.date
+# keeps working. Virtual: computed when selected, never stored.
+DATE_TEXT = "date(day * 86400, 'unixepoch')"
+
+
+def _create_triggers(month: str, date_column: str) -> None:
+    """Create the rollup and change counter triggers of transactions.
+
+    Args:
+        month: Expression of the YYYY-MM month of a row, with {row} standing
+            for NEW or OLD
+        date_column: Stored date column of transactions
+    """
+
+    def key(row: str) -> str:
+        return (
+            f"{month.format(row=row)}, {row}.category_id, "
+            f"CASE WHEN {row}.amount_cents < 0 THEN -1 ELSE 1 END"
+        )
+
+    def add(row: str) -> str:
+        return f"""
+            INSERT INTO transaction_rollups
+                (month, category_id, sign, total_cents, count)
+            VALUES ({key(row)}, {row}.amount_cents, 1)
+            ON CONFLICT (month, category_id, sign) DO UPDATE
+            SET total_cents = total_cents + excluded.total_cents, count = count + 1;
+        """
+
+    def remove(row: str) -> str:
+        return f"""
+            UPDATE transaction_rollups
+            SET total_cents = total_cents - {row}.amount_cents, count = count - 1
+            WHERE (month, category_id, sign) = ({key(row)});
+            DELETE FROM transaction_rollups
+            WHERE (month, category_id, sign) = ({key(row)}) AND count = 0;
+        """
+
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_insert AFTER INSERT ON transactions
+        BEGIN {add("NEW")} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_delete AFTER DELETE ON transactions
+        BEGIN {remove("OLD")} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER transactions_rollup_update
+        AFTER UPDATE OF amount_cents, category_id, {date_column} ON transactions
+        BEGIN {remove("OLD")} {add("NEW")} END
+        """
+    )
+    for event in ("UPDATE", "DELETE"):
+        op.execute(
+            f"""
+            CREATE TRIGGER transactions_count_{event.lower()}
+            AFTER {event} ON transactions
+            BEGIN
+                UPDATE change_counters SET value = value + 1
+                WHERE name = 'transaction_edits';
+            END
+            """
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The CLI used to only check the shape of dates, so refuse to guess
+    # what an impossible date such as 2025-02-30 was meant to be
+    invalid = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT id, date FROM transactions "
+                "WHERE date(julianday(date)) IS NOT date LIMIT 10"
+            )
+        )
+        .fetchall()
+    )
+    if invalid:
+        rows = ", ".join(f"#{id} {date!r}" for id, date in invalid)
+        raise RuntimeError(
+            f"Transactions with invalid dates must be fixed first: {rows}"
+        )
+
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER {trigger}")
+    op.drop_index("ix_transactions_date_created_at", table_name="transactions")
+
+    op.add_column("transactions", sa.Column("day", sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE transactions "
+        f"SET day = CAST(julianday(date) - {UNIX_EPOCH_JULIAN_DAY} AS INTEGER)"
+    )
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("day", nullable=False)
+        batch_op.drop_column("date")
+    op.add_column(
+        "transactions",
+        sa.Column("date", sa.String(), sa.Computed(DATE_TEXT, persisted=False)),
+    )
+
+    op.create_index(
+        "ix_transactions_day_created_at", "transactions", ["day", "created_at"]
+    )
+    _create_triggers("strftime('%Y-%m', {row}.day * 86400, 'unixepoch')", "day")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER {trigger}")
+    op.drop_index("ix_transactions_day_created_at", table_name="transactions")
+
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_column("date")
+    op.add_column("transactions", sa.Column("date", sa.String(), nullable=True))
+    op.execute(f"UPDATE transactions SET date = {DATE_TEXT}")
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("date", nullable=False)
+        batch_op.drop_column("day")
+
+    op.create_index(
+        "ix_transactions_date_created_at", "transactions", ["date", "created_at"]
+    )
+    _create_triggers("substr({row}.date, 1, 7)", "date")
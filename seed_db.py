@@ -1,121 +1,180 @@
 #!/usr/bin/env python3
 """
 Database seeding of mock financial transaction data.
+
+Transactions are generated column by column with NumPy, so millions of
+rows take seconds to generate. The same seed always produces the same
+rows, which makes the data usable by benchmarks (see benchmarks/hot_paths.py).
+
+Usage: python seed_db.py [--rows 200] [--seed 42]
 """
 
-import random
-from datetime import datetime, timedelta
+import argparse
+from collections.abc import Iterator
+from datetime import date
 
+import numpy as np
 from faker import Faker
 
+from src.clifin.models.day import from_day, to_day
+from src.clifin.models.money import from_cents
 from src.clifin.models.transaction import Transaction
 from src.clifin.repositories.transaction_repository import TransactionRepository
 
-
-def generate_mock_transactions(num_transactions: int = 200) -> list[Transaction]:
+# Realistic categories and their typical amounts
+REVENUE_CATEGORIES = {
+    "Salary": (2500, 8000),
+    "Freelance": (200, 2000),
+    "Investment": (50, 1000),
+    "Business": (100, 5000),
+    "Gift": (20, 500),
+    "Refund": (10, 300),
+    "Bonus": (100, 2000),
+}
+
+EXPENSE_CATEGORIES = {
+    "Food": (10, 200),
+    "Transportation": (5, 150),
+    "Entertainment": (15, 300),
+    "Shopping": (20, 800),
+    "Bills": (50, 400),
+    "Healthcare": (30, 500),
+    "Education": (50, 1000),
+    "Travel": (100, 2000),
+    "Home": (100, 800),
+    "Insurance": (50, 300),
+    "Subscription": (5, 50),
+    "Personal Care": (10, 150),
+}
+
+# Realistic titles for each category
+TITLE_TEMPLATES = {
+    "Salary": ["Monthly Salary", "Bi-weekly Pay", "Salary Deposit"],
+    "Freelance": ["Freelance Project", "Consulting Fee", "Side Gig"],
+    "Investment": ["Dividend Payment", "Stock Sale", "Crypto Gain"],
+    "Business": ["Business Income", "Service Revenue", "Product Sale"],
+    "Gift": ["Birthday Gift", "Holiday Gift", "Cash Gift"],
+    "Refund": ["Tax Refund", "Purchase Refund", "Service Refund"],
+    "Bonus": ["Performance Bonus", "Year-end Bonus", "Overtime Pay"],
+    "Food": ["Grocery Shopping", "Restaurant", "Coffee", "Lunch"],
+    "Transportation": ["Gas", "Uber", "Bus Ticket", "Car Maintenance"],
+    "Entertainment": ["Movie Tickets", "Concert", "Streaming Service"],
+    "Shopping": ["Clothes", "Electronics", "Home Goods", "Online Purchase"],
+    "Bills": ["Electricity", "Water", "Internet", "Phone Bill"],
+    "Healthcare": ["Doctor Visit", "Pharmacy", "Dental Care"],
+    "Education": ["Course Fee", "Books", "Online Learning"],
+    "Travel": ["Flight Ticket", "Hotel", "Vacation Expense"],
+    "Home": ["Rent", "Mortgage", "Home Repair", "Furniture"],
+    "Insurance": ["Health Insurance", "Car Insurance", "Home Insurance"],
+    "Subscription": ["Netflix", "Spotify", "Gym Membership", "Magazine"],
+    "Personal Care": ["Haircut", "Spa", "Cosmetics", "Fitness"],
+}
+
+# Descriptions are drawn from a pool of Faker sentences, since generating
+# one sentence per row would dominate the generation time
+DESCRIPTION_POOL_SIZE = 1000
+
+
+def generate_columns(
+    num_transactions: int,
+    seed: int = 42,
+    days: int = 365,
+    end_date: date | None = None,
+) -> dict[str, np.ndarray]:
+    """Generate mock transactions as NumPy columns, oldest first.
+
+    Every column is drawn in one vectorized call, so generation scales to
+    millions of rows. 40% of the transactions are revenues and 30% have a
+    description.
+
+    Args:
+        num_transactions: Number of rows to generate
+        seed: Random seed; the same seed always generates the same rows
+        days: Number of days the transactions are spread over
+        end_date: Date of the most recent transactions (default: today)
+
+    Returns:
+        dict[str, np.ndarray]: title, amount_cents, category, day and
+            description columns
+    """
+    rng = np.random.default_rng(seed)
     fake = Faker()
-    Faker.seed(42)  # For reproducible results
-    random.seed(42)
-
-    # Define realistic categories and their typical amounts
-    revenue_categories = {
-        "Salary": (2500, 8000),
-        "Freelance": (200, 2000),
-        "Investment": (50, 1000),
-        "Business": (100, 5000),
-        "Gift": (20, 500),
-        "Refund": (10, 300),
-        "Bonus": (100, 2000),
+    Faker.seed(seed)
+
+    categories = [*REVENUE_CATEGORIES, *EXPENSE_CATEGORIES]
+    ranges = [*REVENUE_CATEGORIES.values(), *EXPENSE_CATEGORIES.values()]
+    low_cents = np.array([low * 100 for low, _ in ranges])
+    high_cents = np.array([high * 100 for _, high in ranges])
+
+    # Revenue categories come first in `categories`, expenses after them
+    is_revenue = rng.random(num_transactions) < 0.4
+    category_index = np.where(
+        is_revenue,
+        rng.integers(0, len(REVENUE_CATEGORIES), num_transactions),
+        len(REVENUE_CATEGORIES)
+        + rng.integers(0, len(EXPENSE_CATEGORIES), num_transactions),
+    )
+    amount_cents = rng.integers(
+        low_cents[category_index], high_cents[category_index], endpoint=True
+    )
+    amount_cents = np.where(is_revenue, amount_cents, -amount_cents)
+
+    # Titles of all categories in one array, each category a contiguous run
+    titles = np.array(
+        [title for category in categories for title in TITLE_TEMPLATES[category]],
+        dtype=object,
+    )
+    counts = np.array([len(TITLE_TEMPLATES[category]) for category in categories])
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    title_index = offsets[category_index] + rng.integers(0, counts[category_index])
+
+    pool = np.array(
+        [fake.sentence(nb_words=5) for _ in range(DESCRIPTION_POOL_SIZE)],
+        dtype=object,
+    )
+    description = np.where(
+        rng.random(num_transactions) < 0.3,
+        pool[rng.integers(0, DESCRIPTION_POOL_SIZE, num_transactions)],
+        None,
+    )
+
+    last_day = to_day(end_date or date.today())
+    day = np.sort(last_day - rng.integers(0, days, num_transactions))
+
+    return {
+        "title": titles[title_index],
+        "amount_cents": amount_cents,
+        "category": np.array(categories, dtype=object)[category_index],
+        "day": day,
+        "description": description,
     }
 
-    expense_categories = {
-        "Food": (10, 200),
-        "Transportation": (5, 150),
-        "Entertainment": (15, 300),
-        "Shopping": (20, 800),
-        "Bills": (50, 400),
-        "Healthcare": (30, 500),
-        "Education": (50, 1000),
-        "Travel": (100, 2000),
-        "Home": (100, 800),
-        "Insurance": (50, 300),
-        "Subscription": (5, 50),
-        "Personal Care": (10, 150),
-    }
 
-    transactions = []
-    start_date = datetime.now() - timedelta(days=365)  # Last year
-
-    for i in range(num_transactions):
-        # Random date within the last year
-        random_days = random.randint(0, 365)
-        transaction_date = start_date + timedelta(days=random_days)
-
-        # Decide if it's revenue or expense (60% expenses, 40% revenue for realism)
-        is_revenue = random.random() < 0.4
-
-        if is_revenue:
-            category = random.choice(list(revenue_categories.keys()))
-            min_amount, max_amount = revenue_categories[category]
-            amount = round(random.uniform(min_amount, max_amount), 2)
-        else:
-            category = random.choice(list(expense_categories.keys()))
-            min_amount, max_amount = expense_categories[category]
-            amount = -round(
-                random.uniform(min_amount, max_amount), 2
-            )  # Negative for expenses
-
-        # Generate realistic title based on category
-        title_templates = {
-            "Salary": ["Monthly Salary", "Bi-weekly Pay", "Salary Deposit"],
-            "Freelance": ["Freelance Project", "Consulting Fee", "Side Gig"],
-            "Investment": ["Dividend Payment", "Stock Sale", "Crypto Gain"],
-            "Business": ["Business Income", "Service Revenue", "Product Sale"],
-            "Gift": ["Birthday Gift", "Holiday Gift", "Cash Gift"],
-            "Refund": ["Tax Refund", "Purchase Refund", "Service Refund"],
-            "Bonus": ["Performance Bonus", "Year-end Bonus", "Overtime Pay"],
-            "Food": ["Grocery Shopping", "Restaurant", "Coffee", "Lunch"],
-            "Transportation": ["Gas", "Uber", "Bus Ticket", "Car Maintenance"],
-            "Entertainment": ["Movie Tickets", "Concert", "Streaming Service"],
-            "Shopping": ["Clothes", "Electronics", "Home Goods", "Online Purchase"],
-            "Bills": ["Electricity", "Water", "Internet", "Phone Bill"],
-            "Healthcare": ["Doctor Visit", "Pharmacy", "Dental Care"],
-            "Education": ["Course Fee", "Books", "Online Learning"],
-            "Travel": ["Flight Ticket", "Hotel", "Vacation Expense"],
-            "Home": ["Rent", "Mortgage", "Home Repair", "Furniture"],
-            "Insurance": ["Health Insurance", "Car Insurance", "Home Insurance"],
-            "Subscription": ["Netflix", "Spotify", "Gym Membership", "Magazine"],
-            "Personal Care": ["Haircut", "Spa", "Cosmetics", "Fitness"],
-        }
-
-        title = random.choice(title_templates[category])
-
-        # Sometimes add description
-        description = None
-        if random.random() < 0.3:  # 30% chance of having a description
-            if is_revenue:
-                description = fake.sentence(nb_words=6)
-            else:
-                description = fake.sentence(nb_words=4)
-
-        transaction = Transaction(
+def iter_transactions(columns: dict[str, np.ndarray]) -> Iterator[Transaction]:
+    """Build Transactions from generated columns, one row at a time."""
+    for title, cents, category, day, description in zip(
+        columns["title"],
+        columns["amount_cents"].tolist(),
+        columns["category"],
+        columns["day"].tolist(),
+        columns["description"],
+    ):
+        yield Transaction(
             id=None,
             title=title,
-            amount=amount,
+            amount=from_cents(cents),
             category=category,
-            date=transaction_date.strftime("%Y-%m-%d"),
+            date=from_day(day),
             description=description,
         )
 
-        transactions.append(transaction)
-
-    # Sort by date for realism
-    transactions.sort(key=lambda x: x.date)
 
-    return transactions
+def generate_mock_transactions(num_transactions: int = 200) -> list[Transaction]:
+    """Generate mock transactions, oldest first (see `generate_columns`)."""
+    return list(iter_transactions(generate_columns(num_transactions)))
 
 
-def seed_database():
+def seed_database(num_transactions: int = 200, seed: int = 42):
     print("🌱 Seeding database with mock financial data...")
 
     # Initialize database if needed
@@ -133,20 +192,21 @@ def seed_database():
         conn.commit()
 
     # Generate and insert mock data
-    transactions = generate_mock_transactions(200)
-    print(f"📊 Generated {len(transactions)} mock transactions")
-
-    inserted_count = 0
-    for transaction in transactions:
-        try:
-            _transaction_id = repo.create(transaction)
-            inserted_count += 1
-        except Exception as e:
-            print(f"❌ Error inserting transaction: {e}")
-            continue
+    columns = generate_columns(num_transactions, seed)
+    print(f"📊 Generated {num_transactions} mock transactions")
+
+    try:
+        inserted_count = repo.create_many(iter_transactions(columns))
+    except Exception as e:
+        print(f"❌ Error inserting transactions: {e}")
+        return
 
     print(f"✅ Successfully seeded database with {inserted_count} transactions")
 
 
 if __name__ == "__main__":
-    seed_database()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    seed_database(args.rows, args.seed)
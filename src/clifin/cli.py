@@ -0,0 +1,777 @@
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+# Keep module-level imports to what `add`/`list` need: this module is the
+# CLI entry point, so everything imported here is paid by every command.
+# Modules only used by a few commands are imported inside them, and
+# benchmarks/startup.py enforces the startup budget.
+from .db.profiling import PROFILE_ENV, PROFILE_OUTPUT_ENV, enable_profiling
+from .models.day import parse_date
+from .models.money import to_cents
+from .models.transaction import Transaction, TransactionFilter, TransactionUpdate
+from .repositories.category_repository import CategoryRepository
+from .repositories.transaction_repository import TransactionRepository
+
+app = typer.Typer()
+db_app = typer.Typer(help="Database maintenance commands.")
+app.add_typer(db_app, name="db")
+category_app = typer.Typer(help="Category commands.")
+app.add_typer(category_app, name="category")
+repo = TransactionRepository()
+
+
+@app.callback()
+def profile_command(
+    ctx: typer.Context,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            envvar=PROFILE_ENV,
+            help="Print the time of each repository method and SQL query",
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Path | None,
+        typer.Option(
+            envvar=PROFILE_OUTPUT_ENV,
+            help="Also write cProfile stats of the command to this file",
+        ),
+    ] = None,
+):
+    """Personal finance manager."""
+    if not profile and profile_output is None:
+        return
+
+    profiler = enable_profiling()
+    profiler.instrument(TransactionRepository, CategoryRepository)
+    cprofile = None
+    if profile_output is not None:
+        import cProfile
+
+        cprofile = cProfile.Profile()
+        cprofile.enable()
+    start = time.perf_counter()
+
+    def report():
+        elapsed = time.perf_counter() - start
+        if cprofile is not None:
+            cprofile.disable()
+            cprofile.dump_stats(profile_output)
+        typer.echo(
+            f"\n=== Profile: clifin {ctx.invoked_subcommand} "
+            f"({elapsed * 1000:.1f} ms) ===",
+            err=True,
+        )
+        typer.echo(profiler.report(), err=True)
+        if cprofile is not None:
+            typer.echo(
+                f"cProfile stats written to {profile_output} "
+                f"(view with: python -m pstats {profile_output})",
+                err=True,
+            )
+
+    # Runs after the command, also when it aborts
+    ctx.call_on_close(report)
+
+
+def validate_title(title: str):
+    if not title:
+        typer.echo("Title cannot be empty")
+        raise typer.Abort()
+
+
+def validate_date(date: str):
+    if date:
+        # If date is passed, it must be a real YYYY-MM-DD calendar date
+        try:
+            parse_date(date)
+        except ValueError as e:
+            typer.echo(str(e))
+            raise typer.Abort()
+
+
+def validate_amount(amount: str):
+    if not amount.isdigit() or int(amount) <= 0:
+        typer.echo("Amount must be a positive number")
+        raise typer.Abort()
+    try:
+        to_cents(int(amount))
+    except ValueError as e:
+        typer.echo(str(e))
+        raise typer.Abort()
+
+
+def validate_category(category: str):
+    if not category:
+        typer.echo("Category cannot be empty")
+        raise typer.Abort()
+
+
+@app.command()
+def add(title: str, amount: str, category: str, description: str = "", date: str = ""):
+    """(Add) Insert a new revenue."""
+    validate_title(title)
+    validate_amount(amount)
+    validate_date(date)
+    validate_category(category)
+
+    # Use current date if not provided
+    transaction_date = date if date else datetime.now().strftime("%Y-%m-%d")
+
+    transaction = Transaction(
+        id=None,
+        title=title,
+        amount=float(amount),
+        category=category,
+        description=description if description else None,
+        date=transaction_date,
+    )
+
+    transaction_id = repo.create(transaction)
+    typer.echo(
+        f"✓ Added revenue #{transaction_id}: {title} (+${amount}) [{transaction_date}]"
+    )
+
+
+@app.command()
+def sub(title: str, amount: str, category: str, description: str = "", date: str = ""):
+    """(Subtract) Insert a new expense."""
+    validate_title(title)
+    validate_amount(amount)
+    validate_date(date)
+    validate_category(category)
+
+    # Use current date if not provided
+    transaction_date = date if date else datetime.now().strftime("%Y-%m-%d")
+
+    # Store expenses as negative amounts
+    transaction = Transaction(
+        id=None,
+        title=title,
+        amount=-float(amount),  # Negative for expenses
+        category=category,
+        description=description if description else None,
+        date=transaction_date,
+    )
+
+    transaction_id = repo.create(transaction)
+    typer.echo(
+        f"✓ Added expense #{transaction_id}: {title} (-${amount}) [{transaction_date}]"
+    )
+
+
+def parse_ids(ids: list[str]) -> list[int]:
+    try:
+        return [int(id) for id in ids]
+    except ValueError:
+        typer.echo("Error: ID must be a number")
+        raise typer.Abort()
+
+
+# Keys accepted by --where, e.g. --where category=Food --where to=2024-12-31
+WHERE_KEYS = ("category", "from", "to", "min", "max", "type", "match")
+
+
+def parse_where(conditions: list[str]) -> TransactionFilter:
+    """Build a TransactionFilter from `key=value` --where conditions."""
+    filters = TransactionFilter()
+    categories: list[str] = []
+    for condition in conditions:
+        key, sep, value = condition.partition("=")
+        key, value = key.strip().lower(), value.strip()
+        if not sep or key not in WHERE_KEYS or not value:
+            typer.echo(
+                f"Invalid condition {condition!r}, use key=value with key one of: "
+                f"{', '.join(WHERE_KEYS)}"
+            )
+            raise typer.Abort()
+
+        if key == "category":
+            categories.append(value)
+        elif key in ("from", "to"):
+            validate_date(value)
+            if key == "from":
+                filters.start_date = value
+            else:
+                filters.end_date = value
+        elif key in ("min", "max"):
+            try:
+                amount = float(value)
+            except ValueError:
+                typer.echo(f"Invalid amount in {condition!r}")
+                raise typer.Abort()
+            if key == "min":
+                filters.min_amount = amount
+            else:
+                filters.max_amount = amount
+        elif key == "type":
+            if value not in ("expense", "revenue"):
+                typer.echo("type must be expense or revenue")
+                raise typer.Abort()
+            filters.sign = -1 if value == "expense" else 1
+        else:
+            filters.text = value
+
+    filters.categories = categories if categories else None
+    return filters
+
+
+@app.command()
+def delete(
+    ids: Annotated[
+        list[str] | None, typer.Argument(help="IDs of the entries to delete")
+    ] = None,
+    where: Annotated[
+        list[str] | None,
+        typer.Option(
+            help=f"Delete entries matching key=value ({', '.join(WHERE_KEYS)})"
+        ),
+    ] = None,
+    force: Annotated[
+        bool, typer.Option(help="Delete without asking for confirmation")
+    ] = False,
+):
+    """Delete entries from the database, by ID or matching --where conditions."""
+    if not ids and not where:
+        typer.echo("Error: Pass the IDs to delete or --where conditions")
+        raise typer.Abort()
+
+    transaction_ids = parse_ids(ids) if ids else None
+    filters = parse_where(where) if where else None
+
+    if not force:
+        # The prompt says how much goes: one statement can delete thousands
+        if filters is not None:
+            target = f"EVERY entry matching {' '.join(where or [])}"
+            if transaction_ids:
+                target += f" among the {len(transaction_ids)} IDs given"
+        elif transaction_ids and len(transaction_ids) > 1:
+            target = f"these {len(transaction_ids)} entries"
+        else:
+            target = "this entry"
+        if not typer.confirm(f"Are you sure you want to delete {target}?"):
+            typer.echo("Operation cancelled.")
+            raise typer.Abort()
+
+    if transaction_ids and len(transaction_ids) == 1 and filters is None:
+        transaction_id = transaction_ids[0]
+
+        # Deletes and returns the row in one statement
+        transaction = repo.delete_returning(transaction_id)
+        if not transaction:
+            typer.echo(f"Error: Transaction #{transaction_id} not found")
+            raise typer.Abort()
+
+        typer.echo(f"✓ Deleted transaction #{transaction_id}: {transaction.title}")
+        return
+
+    try:
+        deleted = repo.delete_many(transaction_ids, filters)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Abort()
+    typer.echo(f"✓ Deleted {deleted} transactions")
+
+
+@app.command()
+def update(
+    ids: Annotated[
+        list[str] | None, typer.Argument(help="IDs of the entries to update")
+    ] = None,
+    where: Annotated[
+        list[str] | None,
+        typer.Option(
+            help=f"Update entries matching key=value ({', '.join(WHERE_KEYS)})"
+        ),
+    ] = None,
+    title: str = "",
+    amount: str = "",
+    category: str = "",
+    description: str = "",
+    date: str = "",
+):
+    """Update entries in the database, by ID or matching --where conditions."""
+    validate_title(title) if title else None
+    validate_amount(amount) if amount else None
+    validate_date(date) if date else None
+    validate_category(category) if category else None
+
+    if not ids and not where:
+        typer.echo("Error: Pass the IDs to update or --where conditions")
+        raise typer.Abort()
+
+    transaction_ids = parse_ids(ids) if ids else None
+    filters = parse_where(where) if where else None
+
+    # Build update object with only provided fields
+    # This is type-safe and clearer than using **kwargs
+    updates = TransactionUpdate(
+        title=title if title else None,
+        amount=float(amount) if amount else None,
+        category=category if category else None,
+        description=description if description else None,
+        date=date if date else None,
+    )
+
+    # Check if user provided any updates
+    if not updates.has_updates():
+        typer.echo("No fields to update")
+        raise typer.Abort()
+
+    if transaction_ids and len(transaction_ids) == 1 and filters is None:
+        transaction_id = transaction_ids[0]
+
+        # Updates and returns the row in one statement
+        if not repo.update_returning(transaction_id, updates):
+            typer.echo(f"Error: Transaction #{transaction_id} not found")
+            raise typer.Abort()
+
+        typer.echo(f"✓ Updated transaction #{transaction_id}")
+        return
+
+    try:
+        updated = repo.update_many(updates, transaction_ids, filters)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Abort()
+    typer.echo(f"✓ Updated {updated} transactions")
+
+
+@app.command("import")
+def import_(
+    path: Annotated[Path, typer.Argument(exists=True)],
+    batch_size: Annotated[
+        int, typer.Option(min=1, help="Rows written per database transaction")
+    ] = 5000,
+    format: Annotated[
+        str,
+        typer.Option(
+            help="File format (csv, jsonl, parquet or arrow), detected if omitted"
+        ),
+    ] = "",
+    jobs: Annotated[
+        int,
+        typer.Option(
+            min=0,
+            help="Parse files in this many worker processes (0: one per CPU)",
+        ),
+    ] = 1,
+):
+    """Import transactions from a CSV, JSONL, Parquet or Arrow file or directory."""
+    from .importers import read_column_batches, read_transactions
+
+    start = time.perf_counter()
+    if jobs == 1:
+        try:
+            imported = repo.create_many(
+                read_transactions(path, format if format else None), batch_size
+            )
+        except ValueError as e:
+            # Batches before the invalid row are already committed
+            typer.echo(f"Error: {e}")
+            typer.echo("Batches committed before this row were kept")
+            raise typer.Abort()
+    else:
+        # Workers parse and validate whole files; this process is the only
+        # writer, inserting them in file order
+        imported = 0
+        try:
+            for _, arrays in read_column_batches(
+                path, format if format else None, jobs or None
+            ):
+                imported += repo.create_arrays(arrays, batch_size)
+        except ValueError as e:
+            # Files are validated before any of their rows are written
+            typer.echo(f"Error: {e}")
+            typer.echo(
+                f"{imported} transactions from the files before this one were kept"
+            )
+            raise typer.Abort()
+    elapsed = time.perf_counter() - start
+
+    rate = imported / elapsed if elapsed > 0 else 0
+    typer.echo(
+        f"✓ Imported {imported} transactions in {elapsed:.2f}s ({rate:,.0f} rows/s)"
+    )
+
+
+@app.command()
+def export(
+    path: Annotated[
+        Path, typer.Argument(help="File, or directory with --partition-by-month")
+    ],
+    format: Annotated[
+        str,
+        typer.Option(help="parquet, arrow or csv, detected from the suffix if omitted"),
+    ] = "",
+    where: Annotated[
+        list[str] | None,
+        typer.Option(
+            help=f"Only export entries matching key=value ({', '.join(WHERE_KEYS)})"
+        ),
+    ] = None,
+    partition_by_month: Annotated[
+        bool, typer.Option(help="Write one month=YYYY-MM/ file per month")
+    ] = False,
+    chunk_size: Annotated[
+        int, typer.Option(min=1, help="Rows read and written per chunk")
+    ] = 50_000,
+):
+    """Export transactions to Parquet, Arrow or CSV for analysis tools."""
+    from .exporters import write_transactions
+
+    if path.exists():
+        typer.echo(f"Error: {path} already exists")
+        raise typer.Abort()
+    if partition_by_month and not format and not path.suffix:
+        format = "parquet"
+
+    filters = parse_where(where) if where else None
+    start = time.perf_counter()
+    try:
+        exported = write_transactions(
+            repo.iter_arrays(filters, chunk_size=chunk_size),
+            path,
+            format if format else None,
+            partition_by_month,
+        )
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Abort()
+    elapsed = time.perf_counter() - start
+
+    rate = exported / elapsed if elapsed > 0 else 0
+    typer.echo(
+        f"✓ Exported {exported} transactions to {path} in {elapsed:.2f}s "
+        f"({rate:,.0f} rows/s)"
+    )
+
+
+@app.command()
+def init():
+    """Initialize the database and run migrations."""
+    import subprocess
+
+    from .db.database import init_db
+
+    try:
+        init_db()
+
+        # Run alembic migrations
+        result = subprocess.run(
+            ["uv", "run", "alembic", "upgrade", "head"], capture_output=True, text=True
+        )
+
+        if result.returncode == 0:
+            typer.echo("✓ Database initialized and migrations applied successfully")
+        else:
+            typer.echo(f"Error running migrations: {result.stderr}")
+            raise typer.Abort()
+    except Exception as e:
+        typer.echo(f"Error initializing database: {e}")
+        raise typer.Abort()
+
+
+@app.command()
+def summary():
+    """Show financial summary."""
+    total_balance = repo.get_total_balance()
+    balance_by_category = repo.get_balance_by_category()
+
+    typer.echo("\n=== Financial Summary ===")
+    typer.echo(f"Total Balance: ${total_balance:.2f}\n")
+
+    if balance_by_category:
+        typer.echo("Balance by Category:")
+        for category, amount in balance_by_category.items():
+            sign = "+" if amount >= 0 else ""
+            typer.echo(f"  {category}: {sign}${amount:.2f}")
+    else:
+        typer.echo("No transactions yet")
+
+
+def echo_transactions(heading: str, transactions: list[Transaction]):
+    typer.echo(f"\n=== {heading} ===")
+    typer.echo(f"{'ID':<5} {'Date':<12} {'Title':<20} {'Category':<15} {'Amount':<10}")
+    typer.echo("-" * 70)
+
+    for t in transactions:
+        amount_str = f"{'+' if t.amount >= 0 else ''}${t.amount:.2f}"
+        typer.echo(
+            f"{t.id:<5} {t.date:<12} {t.title[:20]:<20} {t.category[:15]:<15} {amount_str:<10}"
+        )
+
+
+@app.command()
+def list(
+    limit: Annotated[int, typer.Option(min=1, help="Maximum rows to show")] = 20,
+    offset: Annotated[int, typer.Option(min=0, help="Rows to skip")] = 0,
+    after_id: Annotated[
+        int | None, typer.Option(help="Continue after this transaction ID")
+    ] = None,
+    before_date: Annotated[
+        str, typer.Option(help="Only transactions before this date (YYYY-MM-DD)")
+    ] = "",
+    from_date: Annotated[
+        str, typer.Option("--from", help="Only transactions on or after this date")
+    ] = "",
+    to_date: Annotated[
+        str, typer.Option("--to", help="Only transactions on or before this date")
+    ] = "",
+    category: Annotated[
+        list[str] | None,
+        typer.Option(help="Only this category (repeat for several)"),
+    ] = None,
+    min_amount: Annotated[
+        float | None, typer.Option("--min", min=0, help="Minimum absolute amount")
+    ] = None,
+    max_amount: Annotated[
+        float | None, typer.Option("--max", min=0, help="Maximum absolute amount")
+    ] = None,
+    expenses: Annotated[bool, typer.Option(help="Only expenses")] = False,
+    revenues: Annotated[bool, typer.Option(help="Only revenues")] = False,
+    match: Annotated[
+        str, typer.Option(help="Only transactions whose title or description match")
+    ] = "",
+):
+    """List transactions, optionally filtered."""
+    validate_date(before_date)
+    validate_date(from_date)
+    validate_date(to_date)
+    if expenses and revenues:
+        typer.echo("Use either --expenses or --revenues, not both")
+        raise typer.Abort()
+
+    filters = TransactionFilter(
+        start_date=from_date if from_date else None,
+        end_date=to_date if to_date else None,
+        categories=category if category else None,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        sign=-1 if expenses else 1 if revenues else None,
+        text=match if match else None,
+    )
+
+    try:
+        transactions = repo.get_page(
+            limit=limit,
+            offset=offset,
+            after_id=after_id,
+            before_date=before_date if before_date else None,
+            filters=filters,
+        )
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Abort()
+
+    if not transactions:
+        typer.echo(
+            "No transactions match these filters"
+            if filters.has_filters()
+            else "No transactions yet"
+        )
+        return
+
+    echo_transactions("Transactions", transactions)
+
+    if len(transactions) == limit:
+        # Repeat the filters so the next page continues the same listing
+        options = [f"--limit {limit}", f"--after-id {transactions[-1].id}"]
+        for name, value in (
+            ("--before-date", before_date),
+            ("--from", from_date),
+            ("--to", to_date),
+            ("--min", min_amount),
+            ("--max", max_amount),
+            ("--match", f'"{match}"' if match else ""),
+        ):
+            if value or value == 0:
+                options.append(f"{name} {value}")
+        options.extend(f'--category "{name}"' for name in category or [])
+        if expenses:
+            options.append("--expenses")
+        if revenues:
+            options.append("--revenues")
+        typer.echo(f"\nNext page: clifin list {' '.join(options)}")
+
+
+@app.command()
+def search(
+    query: str,
+    limit: Annotated[int, typer.Option(min=1, help="Maximum rows to show")] = 20,
+):
+    """Search transaction titles and descriptions, best match first."""
+    try:
+        transactions = repo.search(query, limit)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Abort()
+
+    if not transactions:
+        typer.echo(f"No transactions match {query!r}")
+        return
+
+    echo_transactions(f"Results for {query!r}", transactions)
+
+
+@app.command()
+def dashboard():
+    """Launch the Streamlit financial dashboard."""
+    import subprocess
+    import sys
+
+    try:
+        # Get the path to dashboard.py
+        dashboard_path = Path(__file__).parent / "dashboard.py"
+
+        # Run streamlit
+        cmd = [sys.executable, "-m", "streamlit", "run", str(dashboard_path)]
+        typer.echo("🚀 Starting Streamlit dashboard...")
+        typer.echo("Open your browser to view the dashboard")
+        typer.echo("Press Ctrl+C to stop the server")
+
+        subprocess.run(cmd)
+    except KeyboardInterrupt:
+        typer.echo("\n✓ Dashboard stopped")
+    except Exception as e:
+        typer.echo(f"Error starting dashboard: {e}")
+        raise typer.Abort()
+
+
+@db_app.command()
+def tune():
+    """Show the SQLite tuning profile and the settings in effect."""
+    from .db import get_connection, get_tuning_profile, read_active_settings
+
+    profile = get_tuning_profile()
+    with get_connection() as conn:
+        active = read_active_settings(conn)
+
+    configured = profile.pragmas()
+    typer.echo("\n=== Database Tuning ===")
+    typer.echo(f"Profile: {profile.name}\n")
+    typer.echo(f"{'Setting':<15} {'Configured':<12} {'Active':<12}")
+    typer.echo("-" * 40)
+    for pragma, value in active.items():
+        typer.echo(f"{pragma:<15} {str(configured.get(pragma, '-')):<12} {value!s:<12}")
+
+
+@db_app.command("rebuild-rollups")
+def rebuild_rollups():
+    """Recompute the monthly/category summary table from all transactions."""
+    start = time.perf_counter()
+    entries = repo.rebuild_rollups()
+    elapsed = time.perf_counter() - start
+    typer.echo(f"✓ Rebuilt {entries} rollup entries in {elapsed:.2f}s")
+
+
+@db_app.command("check-rollups")
+def check_rollups():
+    """Verify the monthly/category summary table matches the transactions."""
+    mismatches = repo.check_rollups()
+    if not mismatches:
+        typer.echo("✓ Rollups are consistent with transactions")
+        return
+
+    def describe(total: float | None, count: int | None) -> str:
+        return "missing" if total is None else f"${total:.2f} over {count} rows"
+
+    typer.echo(f"Found {len(mismatches)} inconsistent rollup entries:")
+    for m in mismatches:
+        kind = "revenue" if m.sign > 0 else "expense"
+        typer.echo(
+            f"  {m.month} {m.category} ({kind}): "
+            f"expected {describe(m.expected_total, m.expected_count)}, "
+            f"found {describe(m.actual_total, m.actual_count)}"
+        )
+    typer.echo("Run `clifin db rebuild-rollups` to fix them")
+    raise typer.Exit(code=1)
+
+
+@category_app.command("list")
+def list_categories():
+    """List categories and their number of transactions."""
+    categories = repo.categories.get_all()
+    if not categories:
+        typer.echo("No categories yet")
+        return
+
+    typer.echo("\n=== Categories ===")
+    typer.echo(f"{'ID':<5} {'Name':<20} {'Transactions':>12}")
+    typer.echo("-" * 40)
+    for c in categories:
+        typer.echo(f"{c.id:<5} {c.name[:20]:<20} {c.transaction_count:>12}")
+
+
+@category_app.command()
+def rename(name: str, new_name: str):
+    """Rename a category for all of its transactions."""
+    validate_category(new_name)
+
+    try:
+        category = repo.categories.rename(name, new_name)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Abort()
+    typer.echo(
+        f"✓ Renamed category {name} to {new_name} "
+        f"({category.transaction_count} transactions)"
+    )
+
+
+@category_app.command()
+def merge(
+    source: str,
+    target: str,
+    force: Annotated[
+        bool,
+        typer.Option(prompt="Are you sure you want to merge these categories?"),
+    ],
+):
+    """Move every transaction of SOURCE into TARGET and delete SOURCE."""
+    if not force:
+        typer.echo("Operation cancelled.")
+        raise typer.Abort()
+
+    try:
+        moved = repo.categories.merge(source, target)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Abort()
+    typer.echo(f"✓ Merged category {source} into {target} ({moved} transactions)")
+
+
+@app.command()
+def serve(
+    socket: Annotated[
+        Path | None,
+        typer.Option(help="Socket path (default: CLIFIN_SOCKET or a per-user path)"),
+    ] = None,
+):
+    """Keep a warm process answering CLI commands on a Unix socket."""
+    import signal
+    import sys
+
+    from .client import socket_path
+    from .server import create_server
+
+    path = socket or socket_path()
+    try:
+        server = create_server(path)
+    except (RuntimeError, OSError) as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Abort()
+
+    # Stop on `kill` as on Ctrl+C, so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    typer.echo(f"Serving clifin commands on {path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,136 @@
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+# Only the standard library modules needed to talk to the socket are
+# imported here: this runs before the CLI, on every invocation.
+
+SOCKET_ENV = "CLIFIN_SOCKET"  # Socket path of `clifin serve`
+DIRECT_ENV = "CLIFIN_DIRECT"  # Set to 1 to never forward to the server
+# Same as db.profiling.PROFILE_ENV and PROFILE_OUTPUT_ENV, not imported
+# to keep this module light. Profiled commands run directly, so their
+# report covers this process and not the server's.
+PROFILE_ENV = "CLIFIN_PROFILE"
+PROFILE_OUTPUT_ENV = "CLIFIN_PROFILE_OUTPUT"
+
+# Commands forwarded to a running server. Commands that read or write
+# local files, open a browser or prompt for confirmation run directly,
+# since the server has neither the client's working directory nor its
+# terminal. `delete` and `category merge` are forwarded with --force.
+FORWARDED_COMMANDS = ("add", "sub", "list", "search", "summary", "update")
+FORWARDED_WITH_FORCE = ("delete", "category")
+
+
+def socket_path() -> Path:
+    """Get the socket path of `clifin serve`.
+
+    Returns:
+        Path: CLIFIN_SOCKET, or clifin-<uid>.sock in $XDG_RUNTIME_DIR
+            (/tmp if unset)
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return Path(path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(runtime_dir) / f"clifin-{user}.sock"
+
+
+def owned_by_user(path: Path) -> bool:
+    """Check whether a socket file belongs to the current user.
+
+    The default socket may be in /tmp, where another user could create it
+    first to receive the commands, and their output, of this one.
+
+    Args:
+        path: Socket path
+
+    Returns:
+        bool: True if the file exists and is owned by the current user
+    """
+    try:
+        owner = os.stat(path).st_uid
+    except OSError:
+        return False
+    return not hasattr(os, "getuid") or owner == os.getuid()
+
+
+def database_key() -> str | None:
+    """Identify the database the current environment points at.
+
+    Returns:
+        str | None: Absolute CLIFIN_DB_PATH, or None for the default database
+    """
+    path = os.environ.get("CLIFIN_DB_PATH")
+    return str(Path(path).resolve()) if path else None
+
+
+def should_forward(args: list[str]) -> bool:
+    """Check whether a command line can be run by the server."""
+    if not args or os.environ.get(DIRECT_ENV, "") not in ("", "0"):
+        return False
+    if os.environ.get(PROFILE_ENV, "") not in ("", "0"):
+        return False
+    if os.environ.get(PROFILE_OUTPUT_ENV):
+        return False
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    if args[0] in FORWARDED_COMMANDS:
+        return True
+    return args[0] in FORWARDED_WITH_FORCE and "--force" in args
+
+
+def send(sock: socket.socket, message: dict) -> dict | None:
+    """Send one JSON request line and read the JSON response line.
+
+    Returns:
+        dict | None: Response, or None if the connection was closed first
+    """
+    sock.sendall(json.dumps(message).encode() + b"\n")
+    with sock.makefile("rb") as reader:
+        line = reader.readline()
+    return json.loads(line) if line else None
+
+
+def forward(args: list[str]) -> int | None:
+    """Run a command line on a running `clifin serve`, if there is one.
+
+    Args:
+        args: Command line arguments, without the program name
+
+    Returns:
+        int | None: Exit code of the command, or None if it must run
+            directly: no server is running, it serves another database or
+            the command is not forwarded
+    """
+    if not should_forward(args):
+        return None
+
+    path = socket_path()
+    if not owned_by_user(path):
+        # Not running, or a socket someone else created
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            # Not running, or a stale socket left by a crashed server
+            return None
+
+        response = send(sock, {"args": args, "database": database_key()})
+        if response is None:
+            sys.stderr.write("Error: clifin server closed the connection\n")
+            return 1
+        if "error" in response:
+            # E.g. the server serves another database
+            return None
+
+        sys.stdout.write(response["stdout"])
+        sys.stderr.write(response["stderr"])
+        return response["exit_code"]
+    finally:
+        sock.close()
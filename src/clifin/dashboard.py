@@ -1,7 +1,12 @@
+import io
+import threading
+
 import matplotlib.pyplot as plt
 import pandas as pd
 import streamlit as st
 
+from src.clifin.models.change_token import ChangeToken
+from src.clifin.models.money import cents_to_amounts, from_cents
 from src.clifin.repositories.transaction_repository import TransactionRepository
 
 st.set_page_config(page_title="Clifin Dashboard", page_icon="💰", layout="wide")
@@ -9,56 +14,150 @@ st.set_page_config(page_title="Clifin Dashboard", page_icon="💰", layout="wide
 repo = TransactionRepository()
 
 
+class FrameCache:
+    """Transactions DataFrame shared by every session and rerun.
+
+    Validated against the repository's ChangeToken on each rerun: unchanged
+    data is served as is, appended rows are fetched and concatenated, and
+    any update or delete triggers a full reload.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.token: ChangeToken | None = None
+        self.frame: pd.DataFrame | None = None
+
+    def load(self) -> tuple[ChangeToken, pd.DataFrame]:
+        token = repo.get_change_token()
+        with self._lock:
+            if self.token == token and self.frame is not None:
+                return token, self.frame
+
+            if self.frame is not None and self.token and token.is_append_of(self.token):
+                new_rows = repo.fetch_frame(since_id=self.token.max_id)
+                frame = pd.concat([new_rows, self.frame], ignore_index=True)
+            else:
+                frame = repo.fetch_frame()
+
+            # Drop rows inserted after the token was read, so they are
+            # picked up (once) by the next append instead
+            self.frame = frame[frame["id"] <= token.max_id]
+            self.token = token
+            return token, self.frame
+
+
+@st.cache_resource
+def get_frame_cache() -> FrameCache:
+    return FrameCache()
+
+
+@st.cache_data(max_entries=1)
+def summarize(token: ChangeToken, _df: pd.DataFrame) -> dict:
+    """Compute every dashboard figure once per database state."""
+    df = _df
+    # Aggregate exact integer cents, converting only the results to units
+    cents = df["amount_cents"]
+    is_revenue = cents > 0
+    is_expense = cents < 0
+    revenues = df.loc[is_revenue, ["category", "amount_cents"]]
+    expenses = df.loc[is_expense, ["category", "amount_cents"]]
+
+    recent_df = df.sort_values("date", ascending=False).head(10)
+    display_df = recent_df[["date", "title", "category", "amount"]].copy()
+    display_df["date"] = display_df["date"].dt.strftime("%Y-%m-%d")
+    display_df["amount"] = display_df["amount"].apply(lambda x: f"${x:.2f}")
+
+    return {
+        "total_balance": repo.get_total_balance(),
+        "balance_by_category": repo.get_balance_by_category(),
+        "balance_by_month": repo.get_balance_by_month(),
+        "total_revenue": from_cents(int(revenues["amount_cents"].sum())),
+        "total_expenses": from_cents(-int(expenses["amount_cents"].sum())),
+        "transaction_count": len(df),
+        "recent": display_df,
+        "revenue_by_category": cents_to_amounts(
+            revenues.groupby("category")["amount_cents"].sum()
+        )
+        .rename("amount")
+        .sort_values(ascending=False),
+        "expenses_by_category": cents_to_amounts(
+            -expenses.groupby("category")["amount_cents"].sum()
+        )
+        .rename("amount_abs")
+        .sort_values(ascending=False),
+    }
+
+
+def render_png(fig) -> bytes:
+    """Render a figure to PNG bytes and free it.
+
+    Rendered narrower than Streamlit's maximum image width so st.image
+    serves the cached bytes as is instead of resizing them on every rerun.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=150)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=1)
+def category_chart(balance_by_category: dict) -> bytes:
+    fig, ax = plt.subplots(figsize=(8, 6))
+    categories = list(balance_by_category.keys())
+    balances = list(balance_by_category.values())
+    colors = ["green" if b >= 0 else "red" for b in balances]
+    ax.bar(categories, balances, color=colors)
+    ax.set_ylabel("Balance ($)")
+    ax.set_title("Balance by Category")
+    plt.xticks(rotation=45, ha="right")
+    plt.tight_layout()
+    return render_png(fig)
+
+
+@st.cache_data(max_entries=1)
+def monthly_chart(balance_by_month: dict) -> bytes:
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.plot(
+        list(balance_by_month.keys()),
+        list(balance_by_month.values()),
+        marker="o",
+    )
+    ax.set_ylabel("Net Amount ($)")
+    ax.set_title("Monthly Net Income/Expense")
+    ax.axhline(y=0, color="black", linestyle="--", alpha=0.5)
+    plt.xticks(rotation=45, ha="right")
+    plt.tight_layout()
+    return render_png(fig)
+
+
 def main():
     st.title("💰 Clifin Financial Dashboard")
 
-    # Get data
-    transactions = repo.get_all()
-    total_balance = repo.get_total_balance()
-    balance_by_category = repo.get_balance_by_category()
+    # Get data (served from cache unless the database changed)
+    token, df = get_frame_cache().load()
 
-    if not transactions:
+    if df.empty:
         st.info("No transactions yet. Add some transactions to see insights!")
         return
 
-    # Convert to DataFrame for easier analysis
-    df = pd.DataFrame(
-        [
-            {
-                "id": t.id,
-                "title": t.title,
-                "amount": t.amount,
-                "category": t.category,
-                "date": t.date,
-                "description": t.description,
-                "created_at": t.created_at,
-                "is_expense": t.is_expense(),
-                "is_revenue": t.is_revenue(),
-            }
-            for t in transactions
-        ]
-    )
-
-    df["date"] = pd.to_datetime(df["date"])
-    df["amount_abs"] = df["amount"].abs()
+    summary = summarize(token, df)
+    balance_by_category = summary["balance_by_category"]
+    balance_by_month = summary["balance_by_month"]
 
     # Key Metrics
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Total Balance", f"${total_balance:.2f}")
+        st.metric("Total Balance", f"${summary['total_balance']:.2f}")
 
     with col2:
-        total_revenue = df[df["is_revenue"]]["amount"].sum()
-        st.metric("Total Revenue", f"${total_revenue:.2f}")
+        st.metric("Total Revenue", f"${summary['total_revenue']:.2f}")
 
     with col3:
-        total_expenses = df[df["is_expense"]]["amount_abs"].sum()
-        st.metric("Total Expenses", f"${total_expenses:.2f}")
+        st.metric("Total Expenses", f"${summary['total_expenses']:.2f}")
 
     with col4:
-        transaction_count = len(df)
-        st.metric("Total Transactions", transaction_count)
+        st.metric("Total Transactions", summary["transaction_count"])
 
     st.divider()
 
@@ -68,34 +167,14 @@ def main():
     with col1:
         st.subheader("Balance by Category")
         if balance_by_category:
-            fig, ax = plt.subplots(figsize=(8, 6))
-            categories = list(balance_by_category.keys())
-            balances = list(balance_by_category.values())
-            colors = ["green" if b >= 0 else "red" for b in balances]
-            ax.bar(categories, balances, color=colors)
-            ax.set_ylabel("Balance ($)")
-            ax.set_title("Balance by Category")
-            plt.xticks(rotation=45, ha="right")
-            plt.tight_layout()
-            st.pyplot(fig)
+            st.image(category_chart(balance_by_category), use_container_width=True)
         else:
             st.info("No category data available")
 
     with col2:
         st.subheader("Monthly Trends")
-        df["month"] = df["date"].dt.to_period("M")
-        monthly_data = df.groupby("month")["amount"].sum().reset_index()
-        monthly_data["month"] = monthly_data["month"].astype(str)
-
-        if not monthly_data.empty:
-            fig, ax = plt.subplots(figsize=(8, 6))
-            ax.plot(monthly_data["month"], monthly_data["amount"], marker="o")
-            ax.set_ylabel("Net Amount ($)")
-            ax.set_title("Monthly Net Income/Expense")
-            ax.axhline(y=0, color="black", linestyle="--", alpha=0.5)
-            plt.xticks(rotation=45, ha="right")
-            plt.tight_layout()
-            st.pyplot(fig)
+        if balance_by_month:
+            st.image(monthly_chart(balance_by_month), use_container_width=True)
         else:
             st.info("Not enough data for monthly trends")
 
@@ -103,15 +182,10 @@ def main():
 
     # Recent Transactions
     st.subheader("Recent Transactions")
-    recent_df = df.sort_values("date", ascending=False).head(10)
+    recent_df = summary["recent"]
 
     if not recent_df.empty:
-        # Format for display
-        display_df = recent_df[["date", "title", "category", "amount"]].copy()
-        display_df["date"] = display_df["date"].dt.strftime("%Y-%m-%d")
-        display_df["amount"] = display_df["amount"].apply(lambda x: f"${x:.2f}")
-
-        st.dataframe(display_df, use_container_width=True)
+        st.dataframe(recent_df, use_container_width=True)
     else:
         st.info("No recent transactions")
 
@@ -121,21 +195,17 @@ def main():
 
     with col1:
         st.write("**Revenue by Category**")
-        revenue_by_cat = df[df["is_revenue"]].groupby("category")["amount"].sum()
+        revenue_by_cat = summary["revenue_by_category"]
         if not revenue_by_cat.empty:
-            st.dataframe(
-                revenue_by_cat.sort_values(ascending=False), use_container_width=True
-            )
+            st.dataframe(revenue_by_cat, use_container_width=True)
         else:
             st.info("No revenue data")
 
     with col2:
         st.write("**Expenses by Category**")
-        expenses_by_cat = df[df["is_expense"]].groupby("category")["amount_abs"].sum()
+        expenses_by_cat = summary["expenses_by_category"]
         if not expenses_by_cat.empty:
-            st.dataframe(
-                expenses_by_cat.sort_values(ascending=False), use_container_width=True
-            )
+            st.dataframe(expenses_by_cat, use_container_width=True)
         else:
             st.info("No expense data")
 
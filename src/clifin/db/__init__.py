@@ -1,3 +1,29 @@
-from .database import get_connection, init_db
+from .database import (
+    ConnectionPool,
+    close_pool,
+    configure_pool,
+    configure_tuning,
+    get_connection,
+    get_pool,
+    get_tuning_profile,
+    init_db,
+)
+from .profiling import Profiler, enable_profiling, get_profiler
+from .tuning import PROFILES, TuningProfile, read_active_settings
 
-__all__ = ["get_connection", "init_db"]
+__all__ = [
+    "PROFILES",
+    "ConnectionPool",
+    "Profiler",
+    "TuningProfile",
+    "close_pool",
+    "configure_pool",
+    "configure_tuning",
+    "enable_profiling",
+    "get_connection",
+    "get_pool",
+    "get_profiler",
+    "get_tuning_profile",
+    "init_db",
+    "read_active_settings",
+]
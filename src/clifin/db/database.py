@@ -1,20 +1,223 @@
+import atexit
+import os
 import sqlite3
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
 
+from .profiling import ProfilingConnection, get_profiler
+from .tuning import TuningProfile, apply_tuning, profile_from_env
+
 # Database configuration
+# Set CLIFIN_DB_PATH to use a database file other than the project's clifin.db
 DB_NAME = "clifin.db"
-DB_PATH = Path(__file__).parent.parent.parent.parent / DB_NAME
+DB_PATH_ENV = "CLIFIN_DB_PATH"
+DB_PATH = Path(
+    os.environ.get(DB_PATH_ENV) or Path(__file__).parent.parent.parent.parent / DB_NAME
+)
+
+# Connection pool configuration
+# Set CLIFIN_DB_POOL_SIZE=0 to open a fresh connection on every call
+DEFAULT_POOL_SIZE = 4
+POOL_SIZE_ENV = "CLIFIN_DB_POOL_SIZE"
+
+
+_tuning: TuningProfile | None = None
+
+
+def get_tuning_profile() -> TuningProfile:
+    """Get the SQLite tuning profile applied to new connections.
+
+    Read once from the environment (see `tuning.profile_from_env`),
+    defaulting to the "performance" profile.
+
+    Returns:
+        TuningProfile: Active tuning profile
+
+    Raises:
+        RuntimeError: If the environment holds an invalid profile
+    """
+    global _tuning
+    if _tuning is None:
+        try:
+            _tuning = profile_from_env()
+        except ValueError as e:
+            raise RuntimeError(f"Invalid database tuning: {e}") from e
+    return _tuning
+
+
+def configure_tuning(profile: TuningProfile) -> None:
+    """Set the tuning profile used for new connections.
+
+    Idle pooled connections are closed so the profile applies to every
+    connection handed out afterwards.
+
+    Args:
+        profile: Profile to apply
+    """
+    global _tuning
+    _tuning = profile
+    close_pool()
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open a new SQLite connection configured for the repositories.
+
+    Connections may be handed to a different thread by the pool, so
+    thread checks are disabled. A connection is still only used by one
+    thread at a time. While profiling is enabled, connections record the
+    timing of every statement (see `profiling.Profiler`).
+    """
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        factory=ProfilingConnection if get_profiler() else sqlite3.Connection,
+    )
+    conn.row_factory = sqlite3.Row  # Enable dict-like access
+    try:
+        apply_tuning(conn, get_tuning_profile())
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+class ConnectionPool:
+    """Thread-safe pool of reusable SQLite connections.
+
+    Keeps up to `size` idle connections open so repeated repository calls
+    skip connection setup and keep SQLite's page cache warm. The pool never
+    blocks: when every pooled connection is busy a new one is opened, and
+    connections released beyond `size` are closed.
+
+    The pool is bound to the process that created it. After a fork, idle
+    connections inherited from the parent are discarded, never reused.
+    """
+
+    def __init__(self, db_path: Path, size: int = DEFAULT_POOL_SIZE):
+        if size < 0:
+            raise ValueError("Pool size cannot be negative")
+        self.db_path = db_path
+        self.size = size
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take an idle connection from the pool, or open a new one.
+
+        Returns:
+            sqlite3.Connection: Connection owned by the caller until released
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: connections belong to the parent process
+                self._idle = []
+                self._pid = os.getpid()
+            if self._idle:
+                return self._idle.pop()
+        return _connect(self.db_path)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool.
+
+        Any transaction left open by the caller is rolled back first so the
+        next user starts from a clean state.
+
+        Args:
+            conn: Connection previously returned by acquire()
+        """
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            if self._pid == os.getpid() and len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _pool_size_from_env() -> int:
+    value = os.environ.get(POOL_SIZE_ENV)
+    if not value:
+        return DEFAULT_POOL_SIZE
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        raise RuntimeError(f"{POOL_SIZE_ENV} must be an integer, got {value!r}")
+
+
+def get_pool() -> ConnectionPool:
+    """Get the process-wide connection pool, creating it on first use.
+
+    The pool size is read from the CLIFIN_DB_POOL_SIZE environment variable
+    (default: 4). A size of 0 disables pooling.
+
+    Returns:
+        ConnectionPool: Shared pool for DB_PATH
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(DB_PATH, _pool_size_from_env())
+        return _pool
+
+
+def configure_pool(size: int) -> ConnectionPool:
+    """Replace the process-wide connection pool with one of the given size.
+
+    Idle connections of the previous pool are closed.
+
+    Args:
+        size: Maximum number of idle connections kept open (0 disables pooling)
+
+    Returns:
+        ConnectionPool: The new shared pool
+    """
+    global _pool
+    with _pool_lock:
+        previous, _pool = _pool, ConnectionPool(DB_PATH, size)
+    if previous is not None:
+        previous.close()
+    return _pool
+
+
+def close_pool() -> None:
+    """Close all idle pooled connections (registered to run at exit)."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(close_pool)
 
 
 @contextmanager
-def get_connection() -> Generator[sqlite3.Connection, None, None]:
+def get_connection(pooled: bool = True) -> Generator[sqlite3.Connection, None, None]:
     """Context manager for database connections.
 
-    Ensures connections are properly closed and provides
+    By default connections are borrowed from the shared ConnectionPool and
+    returned to it on exit. Pass pooled=False to open and close a dedicated
+    connection, as every call did before pooling was introduced.
+
+    Ensures uncommitted work is rolled back and provides
     row factory for dict-like access.
 
+    Args:
+        pooled: Borrow a connection from the shared pool
+
     Yields:
         sqlite3.Connection: Database connection
 
@@ -23,18 +226,24 @@ def get_connection() -> Generator[sqlite3.Connection, None, None]:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM transactions")
     """
+    pool = get_pool() if pooled else None
     conn = None
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        conn = pool.acquire() if pool else _connect(DB_PATH)
         yield conn
     except sqlite3.Error as e:
         if conn:
             conn.rollback()
+            # Don't hand a connection in an unknown state back to the pool
+            conn.close()
+            conn = None
         raise RuntimeError(f"Database error: {e}") from e
     finally:
         if conn:
-            conn.close()
+            if pool:
+                pool.release(conn)
+            else:
+                conn.close()
 
 
 def init_db() -> None:
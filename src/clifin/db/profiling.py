@@ -0,0 +1,304 @@
+import functools
+import inspect
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+# Environment variables read by the CLI's --profile and --profile-output
+PROFILE_ENV = "CLIFIN_PROFILE"  # e.g. CLIFIN_PROFILE=1
+PROFILE_OUTPUT_ENV = "CLIFIN_PROFILE_OUTPUT"  # cProfile stats file
+
+# Length of statements shown in the report
+_STATEMENT_WIDTH = 70
+
+# Set on instrumented methods to the Profiler timing them
+_PROFILER_ATTR = "__clifin_profiler__"
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Timings of one SQL statement, as run by one repository method.
+
+    `seconds` covers executing the statement and fetching (and decoding)
+    its rows. `rows` counts rows fetched for queries and rows changed for
+    INSERT/UPDATE/DELETE statements.
+    """
+
+    method: str
+    statement: str
+    calls: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class MethodStats:
+    """Wall time of a repository method, including its Python work."""
+
+    method: str
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class Profiler:
+    """Collects per-query and per-repository-method timings.
+
+    Queries are recorded by connections created with `ProfilingConnection`,
+    which `get_connection` uses while profiling is enabled. Each query is
+    attributed to the innermost instrumented repository method running in
+    the same thread (see `instrument`).
+    """
+
+    def __init__(self):
+        self.queries: dict[tuple[str, str], QueryStats] = {}
+        self.methods: dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _current_method(self) -> str:
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else "-"
+
+    def start_query(self, sql: str) -> QueryStats:
+        """Count a run of a statement by the current method.
+
+        Returns:
+            QueryStats: Entry to add the statement's time and rows to
+        """
+        statement = " ".join(sql.split())
+        key = (self._current_method(), statement)
+        with self._lock:
+            stats = self.queries.get(key)
+            if stats is None:
+                stats = self.queries[key] = QueryStats(*key)
+            stats.calls += 1
+            return stats
+
+    def add(self, stats: QueryStats, seconds: float, rows: int = 0) -> None:
+        """Add time and rows to a statement's stats."""
+        with self._lock:
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.rows += rows
+
+    def _enter(self, method: str) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(method)
+
+    def _exit(self, method: str, seconds: float, call: bool) -> None:
+        self._local.stack.pop()
+        with self._lock:
+            stats = self.methods.get(method)
+            if stats is None:
+                stats = self.methods[method] = MethodStats(method)
+            stats.calls += call
+            stats.seconds += seconds
+
+    def _wrap(self, method: str, func: Callable) -> Callable:
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                # Only time spent producing items counts, not the consumer's
+                iterator = func(*args, **kwargs)
+                first = True
+                try:
+                    while True:
+                        self._enter(method)
+                        start = time.perf_counter()
+                        try:
+                            item = next(iterator)
+                        except StopIteration:
+                            return
+                        finally:
+                            self._exit(method, time.perf_counter() - start, first)
+                            first = False
+                        yield item
+                finally:
+                    # Release e.g. the connection of an abandoned iterator now
+                    iterator.close()
+
+            setattr(generator_wrapper, _PROFILER_ATTR, self)
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self._enter(method)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit(method, time.perf_counter() - start, True)
+
+        setattr(wrapper, _PROFILER_ATTR, self)
+        return wrapper
+
+    def instrument(self, *classes: type) -> None:
+        """Time every public method of the given repository classes.
+
+        Methods are replaced on the classes, so every instance is timed,
+        including instances created later. Only meant for profiled runs.
+
+        Calling it again is safe: methods already timed by this profiler
+        are skipped, and methods timed by a previous profiler are wrapped
+        again from the original method, so wrappers never nest.
+
+        Args:
+            classes: Classes whose public methods are wrapped
+        """
+        for cls in classes:
+            for name, func in list(vars(cls).items()):
+                if name.startswith("_") or not inspect.isfunction(func):
+                    continue
+                profiler = getattr(func, _PROFILER_ATTR, None)
+                if profiler is self:
+                    continue
+                if profiler is not None:
+                    func = func.__wrapped__
+                setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", func))
+
+    def report(self, limit: int = 15) -> str:
+        """Format the collected timings, slowest first.
+
+        Args:
+            limit: Maximum number of statements listed
+
+        Returns:
+            str: Multi-line report
+        """
+        with self._lock:
+            methods = sorted(self.methods.values(), key=lambda m: -m.seconds)
+            queries = sorted(self.queries.values(), key=lambda q: -q.seconds)
+
+        lines = []
+        if methods:
+            lines.append(f"{'Repository method':<40} {'calls':>6} {'total ms':>10}")
+            for m in methods:
+                lines.append(f"{m.method:<40} {m.calls:>6} {m.seconds * 1000:>10.2f}")
+            lines.append("")
+
+        total = sum(q.seconds for q in queries)
+        calls = sum(q.calls for q in queries)
+        lines.append(
+            f"{calls} queries, {total * 1000:.2f} ms in SQLite "
+            "(execute and fetch, including row decoding)"
+        )
+        if queries:
+            lines.append(
+                f"{'total ms':>10} {'max ms':>8} {'calls':>6} {'rows':>8}  method / statement"
+            )
+            for q in queries[:limit]:
+                statement = q.statement
+                if len(statement) > _STATEMENT_WIDTH:
+                    statement = statement[: _STATEMENT_WIDTH - 3] + "..."
+                lines.append(
+                    f"{q.seconds * 1000:>10.2f} {q.max_seconds * 1000:>8.2f} "
+                    f"{q.calls:>6} {q.rows:>8}  {q.method}"
+                )
+                lines.append(f"{'':>36}  {statement}")
+            if len(queries) > limit:
+                lines.append(f"... {len(queries) - limit} more statements")
+        return "\n".join(lines)
+
+
+_profiler: Profiler | None = None
+
+
+def get_profiler() -> Profiler | None:
+    """Get the active profiler, or None when profiling is disabled."""
+    return _profiler
+
+
+def enable_profiling() -> Profiler:
+    """Start recording query timings on connections opened from now on.
+
+    Call it before the first database access: pooled connections opened
+    earlier are not instrumented. Every call starts a new, empty profiler,
+    so commands run one after another by a long-running process (such as
+    `clifin serve`) are each reported on their own.
+
+    Returns:
+        Profiler: The new active profiler
+    """
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+
+class ProfilingCursor(sqlite3.Cursor):
+    """Cursor recording the latency and row count of its statements."""
+
+    _stats: QueryStats | None = None
+
+    def _record(self, seconds: float, rows: int = 0) -> None:
+        if self._stats is not None and _profiler is not None:
+            _profiler.add(self._stats, seconds, rows)
+
+    def _run(self, method: Callable, sql: str, parameters) -> "ProfilingCursor":
+        if _profiler is None:
+            return method(sql, parameters)
+        self._stats = _profiler.start_query(sql)
+        start = time.perf_counter()
+        try:
+            method(sql, parameters)
+        finally:
+            elapsed = time.perf_counter() - start
+            # Statements without a result set report the rows they changed
+            changed = self.rowcount if self.description is None else 0
+            self._record(elapsed, max(changed, 0))
+        return self
+
+    def execute(self, sql: str, parameters=(), /) -> "ProfilingCursor":
+        return self._run(super().execute, sql, parameters)
+
+    def executemany(self, sql: str, parameters, /) -> "ProfilingCursor":
+        return self._run(super().executemany, sql, parameters)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._record(time.perf_counter() - start, int(row is not None))
+        return row
+
+    def fetchmany(self, size: int | None = None) -> list:
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._record(time.perf_counter() - start, len(rows))
+        return rows
+
+    def fetchall(self) -> list:
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._record(time.perf_counter() - start, len(rows))
+        return rows
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._record(time.perf_counter() - start)
+            raise
+        self._record(time.perf_counter() - start, 1)
+        return row
+
+
+class ProfilingConnection(sqlite3.Connection):
+    """Connection whose cursors, including `execute` shortcuts, are timed."""
+
+    def cursor(self, factory=ProfilingCursor):  # pyright: ignore[reportIncompatibleMethodOverride]
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters=(), /):  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, parameters, /):  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self.cursor().executemany(sql, parameters)
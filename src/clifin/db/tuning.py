@@ -0,0 +1,160 @@
+import os
+import sqlite3
+from dataclasses import dataclass, fields, replace
+
+# Environment variables
+PROFILE_ENV = "CLIFIN_DB_PROFILE"
+PRAGMA_ENV_PREFIX = "CLIFIN_DB_"  # e.g. CLIFIN_DB_SYNCHRONOUS=full
+
+# Allowed values for text pragmas (PRAGMA values cannot be bound as parameters)
+_CHOICES: dict[str, tuple[str, ...]] = {
+    "journal_mode": ("delete", "truncate", "persist", "memory", "wal", "off"),
+    "synchronous": ("off", "normal", "full", "extra"),
+    "temp_store": ("default", "file", "memory"),
+}
+
+# Values returned by SQLite for numeric pragmas
+_SYNCHRONOUS_NAMES = {0: "off", 1: "normal", 2: "full", 3: "extra"}
+_TEMP_STORE_NAMES = {0: "default", 1: "file", 2: "memory"}
+
+
+@dataclass(frozen=True)
+class TuningProfile:
+    """SQLite PRAGMA settings applied to every new connection.
+
+    A field set to None leaves SQLite's default untouched.
+
+    Note that journal_mode is persisted in the database file: once a
+    database is switched to WAL it stays in WAL until another mode is set.
+    """
+
+    name: str
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    cache_size: int | None = None  # Pages, or KiB when negative
+    mmap_size: int | None = None  # Bytes
+    temp_store: str | None = None
+
+    def pragmas(self) -> dict[str, str | int]:
+        """Get the pragmas this profile sets, excluding None values.
+
+        Returns:
+            dict: Pragma name -> value
+        """
+        result: dict[str, str | int] = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if field.name != "name" and value is not None:
+                result[field.name] = value
+        return result
+
+
+PROFILES: dict[str, TuningProfile] = {
+    # WAL lets the dashboard read while the CLI writes, and synchronous=NORMAL
+    # only fsyncs the WAL at checkpoints instead of on every commit
+    "performance": TuningProfile(
+        name="performance",
+        journal_mode="wal",
+        synchronous="normal",
+        cache_size=-64_000,  # ~64 MiB
+        mmap_size=256 * 1024 * 1024,
+        temp_store="memory",
+    ),
+    # Same as performance but fsyncs on every commit
+    "durable": TuningProfile(
+        name="durable",
+        journal_mode="wal",
+        synchronous="full",
+        cache_size=-64_000,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="memory",
+    ),
+    # Plain SQLite defaults
+    "default": TuningProfile(name="default"),
+}
+DEFAULT_PROFILE = "performance"
+
+
+def _validate(profile: TuningProfile) -> TuningProfile:
+    for pragma, choices in _CHOICES.items():
+        value = getattr(profile, pragma)
+        if value is not None and value not in choices:
+            raise ValueError(
+                f"Invalid {pragma} {value!r}, use one of: {', '.join(choices)}"
+            )
+    return profile
+
+
+def profile_from_env() -> TuningProfile:
+    """Build the tuning profile from environment variables.
+
+    CLIFIN_DB_PROFILE selects a base profile (performance, durable or
+    default). Individual pragmas can then be overridden with
+    CLIFIN_DB_JOURNAL_MODE, CLIFIN_DB_SYNCHRONOUS, CLIFIN_DB_CACHE_SIZE,
+    CLIFIN_DB_MMAP_SIZE and CLIFIN_DB_TEMP_STORE.
+
+    Returns:
+        TuningProfile: Validated profile
+
+    Raises:
+        ValueError: If a profile name or pragma value is invalid
+    """
+    name = os.environ.get(PROFILE_ENV, DEFAULT_PROFILE).lower()
+    if name not in PROFILES:
+        raise ValueError(
+            f"Unknown {PROFILE_ENV} {name!r}, use one of: {', '.join(PROFILES)}"
+        )
+    profile = PROFILES[name]
+
+    overrides: dict[str, str | int] = {}
+    for pragma in ("journal_mode", "synchronous", "temp_store"):
+        value = os.environ.get(f"{PRAGMA_ENV_PREFIX}{pragma.upper()}")
+        if value:
+            overrides[pragma] = value.lower()
+    for pragma in ("cache_size", "mmap_size"):
+        value = os.environ.get(f"{PRAGMA_ENV_PREFIX}{pragma.upper()}")
+        if value:
+            try:
+                overrides[pragma] = int(value)
+            except ValueError:
+                raise ValueError(
+                    f"{pragma} must be an integer, got {value!r}"
+                ) from None
+
+    if overrides:
+        profile = replace(profile, name=f"{name} (customized)", **overrides)
+    return _validate(profile)
+
+
+def apply_tuning(conn: sqlite3.Connection, profile: TuningProfile) -> None:
+    """Apply a tuning profile to a connection.
+
+    Args:
+        conn: Freshly opened connection (outside any transaction)
+        profile: Profile to apply
+    """
+    for pragma, value in _validate(profile).pragmas().items():
+        # Values are validated above, so formatting them in is safe
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+def read_active_settings(conn: sqlite3.Connection) -> dict[str, str | int]:
+    """Read the tuning pragmas currently in effect on a connection.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        dict: Pragma name -> active value
+    """
+    active: dict[str, str | int] = {}
+    for field in fields(TuningProfile):
+        if field.name == "name":
+            continue
+        value = conn.execute(f"PRAGMA {field.name}").fetchone()[0]
+        if field.name == "synchronous":
+            value = _SYNCHRONOUS_NAMES.get(value, value)
+        elif field.name == "temp_store":
+            value = _TEMP_STORE_NAMES.get(value, value)
+        active[field.name] = value
+    return active
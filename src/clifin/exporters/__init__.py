@@ -0,0 +1,3 @@
+from .transaction_exporter import SUPPORTED_FORMATS, detect_format, write_transactions
+
+__all__ = ["SUPPORTED_FORMATS", "detect_format", "write_transactions"]
@@ -0,0 +1,273 @@
+import csv
+from collections.abc import Iterable
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+from ..models.day import days_to_dates
+from ..models.money import cents_to_amounts
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+SUPPORTED_FORMATS = ("parquet", "arrow", "csv")
+
+# File suffix -> export format. Arrow files use the IPC file format
+# (Feather v2), which readers can memory-map.
+_SUFFIX_FORMATS = {
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".csv": "csv",
+}
+
+# Export format -> suffix of the files written
+_FORMAT_SUFFIXES = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+
+# Columns of every export. title, amount, category, date and description
+# are what the importers read back; id and created_at are kept for analysis.
+EXPORT_COLUMNS = (
+    "id",
+    "title",
+    "amount",
+    "amount_cents",
+    "category",
+    "date",
+    "description",
+    "created_at",
+)
+
+
+def detect_format(path: Path) -> str:
+    """Detect the export format of a file from its suffix.
+
+    Args:
+        path: File to write
+
+    Returns:
+        str: One of SUPPORTED_FORMATS
+
+    Raises:
+        ValueError: If the suffix is not recognized
+    """
+    file_format = _SUFFIX_FORMATS.get(path.suffix.lower())
+    if file_format is None:
+        raise ValueError(
+            f"Cannot detect format of {path.name}, use one of: {', '.join(SUPPORTED_FORMATS)}"
+        )
+    return file_format
+
+
+def _schema() -> "pa.Schema":
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("title", pa.string()),
+            ("amount", pa.float64()),
+            ("amount_cents", pa.int64()),
+            ("category", pa.string()),
+            ("date", pa.date32()),
+            ("description", pa.string()),
+            ("created_at", pa.timestamp("s")),
+        ]
+    )
+
+
+def _record_batch(
+    arrays: dict[str, "np.ndarray"], schema: "pa.Schema"
+) -> "pa.RecordBatch":
+    """Build an Arrow record batch from a chunk of `iter_arrays` columns.
+
+    Numeric columns are wrapped without copying, and day numbers are
+    reinterpreted as date32 (days since 1970-01-01, the same epoch).
+    """
+    import pyarrow as pa
+
+    return pa.record_batch(
+        [
+            arrays["id"],
+            arrays["title"],
+            cents_to_amounts(arrays["amount_cents"]),
+            arrays["amount_cents"],
+            arrays["category"],
+            days_to_dates(arrays["day"]),
+            arrays["description"],
+            arrays["created_at"],
+        ],
+        schema=schema,
+    )
+
+
+class _Writer(Protocol):
+    def write(self, arrays: dict[str, "np.ndarray"]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path):
+        import pyarrow.parquet as pq
+
+        self.schema = _schema()
+        # Each chunk becomes a row group, so readers can skip whole chunks
+        # using the min/max statistics of e.g. the date column
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, arrays: dict[str, "np.ndarray"]) -> None:
+        self.writer.write_batch(_record_batch(arrays, self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _ArrowWriter:
+    def __init__(self, path: Path):
+        import pyarrow as pa
+
+        self.schema = _schema()
+        # Uncompressed, so memory-mapped reads need no decoding at all
+        self.sink = pa.OSFile(str(path), "wb")
+        self.writer = pa.ipc.new_file(self.sink, self.schema)
+
+    def write(self, arrays: dict[str, "np.ndarray"]) -> None:
+        self.writer.write_batch(_record_batch(arrays, self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+        self.sink.close()
+
+
+class _CsvWriter:
+    def __init__(self, path: Path):
+        self.file = path.open("w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(EXPORT_COLUMNS)
+
+    def write(self, arrays: dict[str, "np.ndarray"]) -> None:
+        import numpy as np
+
+        # Two decimals of the nearest float are exactly the stored cents
+        amounts = [
+            f"{amount:.2f}" for amount in cents_to_amounts(arrays["amount_cents"])
+        ]
+        self.writer.writerows(
+            zip(
+                arrays["id"].tolist(),
+                arrays["title"],
+                amounts,
+                arrays["amount_cents"].tolist(),
+                arrays["category"],
+                days_to_dates(arrays["day"]).astype(str),
+                arrays["description"],
+                np.datetime_as_string(arrays["created_at"], unit="s"),
+            )
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+_WRITERS: dict[str, type[_Writer]] = {
+    "parquet": _ParquetWriter,
+    "arrow": _ArrowWriter,
+    "csv": _CsvWriter,
+}
+
+
+def _month_slices(
+    arrays: dict[str, "np.ndarray"],
+) -> Iterable[tuple[str, dict[str, "np.ndarray"]]]:
+    """Split a chunk into runs of rows from the same month.
+
+    Chunks are ordered by date, so each month is one contiguous run and
+    the slices are views, not copies.
+    """
+    import numpy as np
+
+    months = days_to_dates(arrays["day"]).astype("datetime64[M]")
+    bounds = [0, *(np.flatnonzero(months[1:] != months[:-1]) + 1), len(months)]
+    for start, end in pairwise(bounds):
+        yield (
+            str(months[start]),
+            {name: values[start:end] for name, values in arrays.items()},
+        )
+
+
+def write_transactions(
+    chunks: Iterable[dict[str, "np.ndarray"]],
+    path: Path,
+    file_format: str | None = None,
+    partition_by_month: bool = False,
+) -> int:
+    """Write transaction column chunks to a Parquet, Arrow or CSV export.
+
+    Chunks are written as they arrive, so exports of any size are written
+    with bounded memory. Pass `TransactionRepository.iter_arrays` chunks,
+    which are ordered newest first.
+
+    With `partition_by_month`, `path` is a directory with one
+    `month=YYYY-MM/part-0.<suffix>` file per month (Hive-style
+    partitioning, understood by pyarrow, pandas, DuckDB and Polars).
+
+    Args:
+        chunks: Column arrays as yielded by `TransactionRepository.iter_arrays`
+        path: File to write, or directory when partitioning by month
+        file_format: "parquet", "arrow" or "csv", detected from the suffix
+            if omitted
+        partition_by_month: Write one file per month under `path`
+
+    Returns:
+        int: Number of transactions written
+
+    Raises:
+        ValueError: If the format is unsupported or the chunks are not
+            ordered by date when partitioning
+    """
+    file_format = file_format or detect_format(path)
+    writer_class = _WRITERS.get(file_format)
+    if writer_class is None:
+        raise ValueError(
+            f"Unsupported format {file_format!r}, use one of: {', '.join(SUPPORTED_FORMATS)}"
+        )
+
+    written = 0
+    if not partition_by_month:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        writer = writer_class(path)
+        try:
+            for arrays in chunks:
+                writer.write(arrays)
+                written += len(arrays["id"])
+        finally:
+            writer.close()
+        return written
+
+    # Only the file of the current month is open at any time
+    path.mkdir(parents=True, exist_ok=True)
+    months_written: set[str] = set()
+    month: str | None = None
+    writer: _Writer | None = None
+    try:
+        for arrays in chunks:
+            for slice_month, rows in _month_slices(arrays):
+                if slice_month != month:
+                    if slice_month in months_written:
+                        raise ValueError("Chunks must be ordered by date to partition")
+                    if writer is not None:
+                        writer.close()
+                    month = slice_month
+                    months_written.add(month)
+                    directory = path / f"month={month}"
+                    directory.mkdir(parents=True, exist_ok=True)
+                    writer = writer_class(
+                        directory / f"part-0{_FORMAT_SUFFIXES[file_format]}"
+                    )
+                writer.write(rows)  # pyright: ignore[reportOptionalMemberAccess]
+                written += len(rows["id"])
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
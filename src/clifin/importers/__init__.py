@@ -0,0 +1,13 @@
+from .transaction_importer import (
+    SUPPORTED_FORMATS,
+    detect_format,
+    read_column_batches,
+    read_transactions,
+)
+
+__all__ = [
+    "SUPPORTED_FORMATS",
+    "detect_format",
+    "read_column_batches",
+    "read_transactions",
+]
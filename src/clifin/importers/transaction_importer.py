@@ -0,0 +1,393 @@
+import contextlib
+import csv
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..models.day import ISO_DATE, dates_to_days, parse_date
+from ..models.money import CENTS_PER_UNIT, MAX_CENTS, amounts_to_cents, to_cents
+from ..models.transaction import Transaction
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+SUPPORTED_FORMATS = ("csv", "jsonl", "parquet", "arrow")
+
+# File suffix -> import format
+_SUFFIX_FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+
+# Columns read from Parquet and Arrow files, the rest (e.g. id) is skipped
+_IMPORT_COLUMNS = ("title", "amount", "category", "date", "description")
+
+# Rows decoded per record batch of Parquet files
+_BATCH_SIZE = 10_000
+
+
+def detect_format(path: Path) -> str:
+    """Detect the import format of a file from its suffix.
+
+    Args:
+        path: File to import
+
+    Returns:
+        str: One of SUPPORTED_FORMATS
+
+    Raises:
+        ValueError: If the suffix is not recognized
+    """
+    file_format = _SUFFIX_FORMATS.get(path.suffix.lower())
+    if file_format is None:
+        raise ValueError(
+            f"Cannot detect format of {path.name}, use one of: {', '.join(SUPPORTED_FORMATS)}"
+        )
+    return file_format
+
+
+def _parse_record(record: Mapping[str, object]) -> Transaction:
+    """Build a Transaction from a raw CSV/JSONL/Parquet/Arrow record.
+
+    Amounts are signed: positive for revenues, negative for expenses.
+
+    Raises:
+        ValueError: If a required field is missing or invalid
+    """
+    title = str(record.get("title") or "").strip()
+    if not title:
+        raise ValueError("Title cannot be empty")
+
+    category = str(record.get("category") or "").strip()
+    if not category:
+        raise ValueError("Category cannot be empty")
+
+    raw_amount = record.get("amount")
+    try:
+        amount = float(raw_amount)  # pyright: ignore[reportArgumentType]
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid amount: {raw_amount!r}") from None
+    # Rejects what cannot be stored (inf, nan, huge amounts) here, where
+    # the error is reported with its file and line. The zero check is on
+    # the stored cents, which -0.004 rounds to.
+    if to_cents(amount) == 0:
+        raise ValueError("Amount cannot be zero")
+
+    # Parquet and Arrow dates are datetime.date, whose str() is YYYY-MM-DD
+    date = str(record.get("date") or "").strip()
+    parse_date(date)
+
+    description = record.get("description")
+    return Transaction(
+        id=None,
+        title=title,
+        amount=amount,
+        category=category,
+        date=date,
+        description=str(description) if description else None,
+    )
+
+
+def _text(values: list) -> "pd.Series":
+    """Vectorized str(value or "").strip() of a column."""
+    import pandas as pd
+
+    return (
+        pd.Series([value or "" for value in values], dtype=object)
+        .astype(str)
+        .str.strip()
+    )
+
+
+def _validate_columns(
+    columns: Mapping[str, list], line_nums: list[int], name: object
+) -> dict[str, "np.ndarray"]:
+    """Vectorized `_parse_record` for the columns of a whole file.
+
+    Applies the same rules as `_parse_record`, and as the CLI's
+    validate_title, validate_category and validate_date, to whole columns
+    at once, with amounts signed: title and category must not be blank,
+    the amount must be a finite number within MAX_CENTS that does not
+    round to zero cents, and the date a real YYYY-MM-DD date.
+
+    Args:
+        columns: Raw values of each of _IMPORT_COLUMNS, None if missing
+        line_nums: Line (or row) number of each record
+        name: File name used in error messages
+
+    Returns:
+        dict[str, np.ndarray]: title, amount_cents, category, day and
+            description arrays, as taken by `TransactionRepository.create_arrays`
+
+    Raises:
+        ValueError: Describing the first invalid record, as
+            `read_transactions` would
+    """
+    import numpy as np
+    import pandas as pd
+
+    title = _text(columns["title"])
+    category = _text(columns["category"])
+    date = _text(columns["date"])
+
+    raw_amounts = pd.Series(columns["amount"], dtype=object)
+    amount = pd.to_numeric(raw_amounts, errors="coerce").to_numpy("float64", copy=True)
+    unparsed = np.isnan(amount)
+    if unparsed.any():
+        # pandas rejects a few spellings float() accepts, e.g. "1_000"
+        for i in np.flatnonzero(unparsed).tolist():
+            value = np.nan
+            with contextlib.suppress(TypeError, ValueError):
+                value = float(raw_amounts[i])
+            amount[i] = value
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        cents = np.round(amount * CENTS_PER_UNIT)
+        out_of_range = np.abs(cents) > MAX_CENTS
+
+    well_formed = date.str.fullmatch(ISO_DATE.pattern).to_numpy(bool)
+    days = pd.to_datetime(date.where(well_formed), format="%Y-%m-%d", errors="coerce")
+
+    # One message per rule, checked in the order of _parse_record
+    rules = [
+        ((title == "").to_numpy(bool), lambda i: "Title cannot be empty"),
+        ((category == "").to_numpy(bool), lambda i: "Category cannot be empty"),
+        (
+            ~np.isfinite(amount),
+            lambda i: f"Invalid amount: {columns['amount'][i]!r}",
+        ),
+        (out_of_range, lambda i: _amount_error(float(amount[i]))),
+        (cents == 0, lambda i: "Amount cannot be zero"),
+        (days.isna().to_numpy(bool), lambda i: _date_error(date[i])),
+    ]
+    invalid = np.logical_or.reduce([mask for mask, _ in rules])
+    if invalid.any():
+        i = int(np.argmax(invalid))
+        message = next(message(i) for mask, message in rules if mask[i])
+        raise ValueError(f"{name}:{line_nums[i]}: {message}")
+
+    return {
+        "title": title.to_numpy(object),
+        "amount_cents": amounts_to_cents(amount),
+        "category": category.to_numpy(object),
+        "day": dates_to_days(days.to_numpy()),
+        "description": np.array(
+            [str(value) if value else None for value in columns["description"]],
+            dtype=object,
+        ),
+    }
+
+
+def _amount_error(amount: float) -> str:
+    """Get the message to_cents raises for an out of range amount."""
+    try:
+        to_cents(amount)
+    except ValueError as e:
+        return str(e)
+    return f"Amount out of range: {amount!r}"
+
+
+def _date_error(date: str) -> str:
+    """Get the message parse_date raises for an invalid date."""
+    try:
+        parse_date(date)
+    except ValueError as e:
+        return str(e)
+    return f"Invalid date: {date!r}"
+
+
+def _iter_csv(path: Path) -> Iterator[tuple[int, dict[str, str]]]:
+    with path.open(newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for record in reader:
+            # Header is line 1, so data rows start at line 2
+            yield reader.line_num, record
+
+
+def _iter_jsonl(path: Path) -> Iterator[tuple[int, dict[str, str | float | None]]]:
+    with path.open(encoding="utf-8") as f:
+        for line_num, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_num, json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path.name}:{line_num}: invalid JSON: {e}") from e
+
+
+def _iter_batches(batches: Iterable["pa.RecordBatch"]) -> Iterator[tuple[int, dict]]:
+    row_num = 0
+    for batch in batches:
+        for record in batch.to_pylist():
+            row_num += 1
+            yield row_num, record
+
+
+def _iter_parquet(path: Path) -> Iterator[tuple[int, dict]]:
+    import pyarrow.parquet as pq
+
+    with pq.ParquetFile(path) as parquet_file:
+        names = parquet_file.schema_arrow.names
+        columns = [name for name in _IMPORT_COLUMNS if name in names]
+        yield from _iter_batches(
+            parquet_file.iter_batches(batch_size=_BATCH_SIZE, columns=columns)
+        )
+
+
+def _iter_arrow(path: Path) -> Iterator[tuple[int, dict]]:
+    import pyarrow as pa
+
+    # Memory-mapped: batches are read in place instead of copied into memory
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        columns = [name for name in _IMPORT_COLUMNS if name in reader.schema.names]
+        yield from _iter_batches(
+            reader.get_batch(i).select(columns)
+            for i in range(reader.num_record_batches)
+        )
+
+
+_READERS: dict[str, Callable[[Path], Iterator[tuple[int, Mapping]]]] = {
+    "csv": _iter_csv,
+    "jsonl": _iter_jsonl,
+    "parquet": _iter_parquet,
+    "arrow": _iter_arrow,
+}
+
+
+def _files(path: Path, file_format: str | None) -> list[Path]:
+    """List the files to import from a file or a (partitioned) directory."""
+    if not path.is_dir():
+        return [path]
+    return sorted(
+        file
+        for file in path.rglob("*")
+        if file.is_file()
+        and _SUFFIX_FORMATS.get(file.suffix.lower())
+        and (file_format is None or detect_format(file) == file_format)
+    )
+
+
+def _read_columns(
+    file: Path, file_format: str, name: str
+) -> tuple[str, dict[str, "np.ndarray"]]:
+    """Parse and validate a whole file into column arrays.
+
+    Runs in the worker processes of `read_column_batches`, so it must stay
+    a module-level function.
+    """
+    records = list(_READERS[file_format](file))
+    line_nums = [line_num for line_num, _ in records]
+    columns = {
+        column: [record.get(column) for _, record in records]
+        for column in _IMPORT_COLUMNS
+    }
+    return name, _validate_columns(columns, line_nums, name)
+
+
+def read_column_batches(
+    path: Path, file_format: str | None = None, jobs: int | None = None
+) -> Iterator[tuple[str, dict[str, "np.ndarray"]]]:
+    """Parse and validate files in parallel worker processes.
+
+    Each file is read, validated and converted to column arrays by a
+    worker process (see `_validate_columns`), so parsing uses every core.
+    Results are yielded in file name order, the order `read_transactions`
+    reads them in, for a single writer such as
+    `TransactionRepository.create_arrays` to insert. At most two files per
+    worker are parsed ahead of the consumer, bounding memory when the
+    writer is slower than the workers. Each file is held in memory whole.
+
+    Args:
+        path: File or directory to read
+        file_format: "csv", "jsonl", "parquet" or "arrow", detected from the
+            suffix if omitted
+        jobs: Number of worker processes, the number of CPUs by default
+
+    Yields:
+        tuple: (file name, arrays) for each file, arrays as taken by
+            `TransactionRepository.create_arrays`
+
+    Raises:
+        ValueError: If the format is unsupported or a row is invalid. Files
+            yielded before the invalid one are complete.
+    """
+    if file_format is not None and file_format not in _READERS:
+        raise ValueError(
+            f"Unsupported format {file_format!r}, use one of: {', '.join(SUPPORTED_FORMATS)}"
+        )
+
+    tasks = (
+        (
+            file,
+            file_format or detect_format(file),
+            str(file.relative_to(path) if file != path else file.name),
+        )
+        for file in _files(path, file_format)
+    )
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(jobs) as executor:
+        pending: deque[Future] = deque()
+        try:
+            for task in tasks:
+                pending.append(executor.submit(_read_columns, *task))
+                if len(pending) >= 2 * jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # On errors, or when the consumer stops early
+            executor.shutdown(cancel_futures=True)
+
+
+def read_transactions(
+    path: Path, file_format: str | None = None
+) -> Iterator[Transaction]:
+    """Stream transactions from a bank export or a clifin export.
+
+    Rows are parsed lazily so files of any size can be piped into
+    `TransactionRepository.create_many` with bounded memory. Parquet and
+    Arrow files are read one record batch at a time.
+
+    Expected fields: title, amount, category, date (YYYY-MM-DD) and an
+    optional description. Other fields, such as the id and created_at of
+    `clifin export` files, are ignored.
+
+    `path` may also be a directory, e.g. an export partitioned by month,
+    in which case every file with a supported suffix is read in name order.
+
+    Args:
+        path: File or directory to read
+        file_format: "csv", "jsonl", "parquet" or "arrow", detected from the
+            suffix if omitted
+
+    Yields:
+        Transaction: Parsed transaction (id is None)
+
+    Raises:
+        ValueError: If the format is unsupported or a row is invalid
+    """
+    if file_format is not None and file_format not in _READERS:
+        raise ValueError(
+            f"Unsupported format {file_format!r}, use one of: {', '.join(SUPPORTED_FORMATS)}"
+        )
+
+    for file in _files(path, file_format):
+        records = _READERS[file_format or detect_format(file)](file)
+        # Line number for text formats, row number for columnar ones
+        name = file.relative_to(path) if file != path else file.name
+        for line_num, record in records:
+            try:
+                yield _parse_record(record)
+            except ValueError as e:
+                raise ValueError(f"{name}:{line_num}: {e}") from e
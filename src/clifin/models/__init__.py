@@ -1,3 +1,25 @@
-from .transaction import Transaction
+from .category import Category
+from .change_token import ChangeToken
+from .day import Day, dates_to_days, days_to_dates, from_day, parse_date, to_day
+from .money import Cents, amounts_to_cents, cents_to_amounts, from_cents, to_cents
+from .rollup import RollupMismatch
+from .transaction import TRANSACTION_COLUMNS, Transaction
 
-__all__ = ["Transaction"]
+__all__ = [
+    "TRANSACTION_COLUMNS",
+    "Category",
+    "Cents",
+    "ChangeToken",
+    "Day",
+    "RollupMismatch",
+    "Transaction",
+    "amounts_to_cents",
+    "cents_to_amounts",
+    "dates_to_days",
+    "days_to_dates",
+    "from_cents",
+    "from_day",
+    "parse_date",
+    "to_cents",
+    "to_day",
+]
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Category:
+    """A transaction category, stored once in the categories table.
+
+    Transactions reference categories by id, so renaming a category is a
+    single-row update.
+    """
+
+    id: int
+    name: str
+    transaction_count: int = 0
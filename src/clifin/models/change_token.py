@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeToken:
+    """Cheap fingerprint of the transactions table, used to validate caches.
+
+    Two equal tokens mean the table has not changed. When only `max_id`
+    and `count` grew (same `edits`), rows were appended and nothing else
+    was modified, so a cache can load just the rows with id > old max_id.
+    """
+
+    max_id: int  # Highest transaction ID (0 when empty)
+    count: int  # Number of transactions
+    edits: int  # Updates and deletes applied so far
+
+    def is_append_of(self, previous: "ChangeToken") -> bool:
+        """Check if this state only adds rows on top of `previous`.
+
+        Args:
+            previous: Token the cached data was loaded with
+
+        Returns:
+            bool: True if rows were only inserted since `previous`
+        """
+        return (
+            self.edits == previous.edits
+            and self.max_id > previous.max_id
+            and self.count > previous.count
+        )
@@ -0,0 +1,95 @@
+import re
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, NewType
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Dates are stored as integer day numbers (days since 1970-01-01), so range
+# filters and sorting compare integers and NumPy can view them as
+# datetime64[D] without parsing any text
+Day = NewType("Day", int)
+
+EPOCH = date(1970, 1, 1)
+
+# The only accepted date text, also checked column-wise by the importer
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def parse_date(value: str) -> date:
+    """Strictly parse a YYYY-MM-DD date.
+
+    Unlike `date.fromisoformat`, only the zero-padded calendar form is
+    accepted (no week dates, ordinal dates or compact forms).
+
+    Args:
+        value: Date text, e.g. "2025-01-31"
+
+    Returns:
+        date: Parsed date
+
+    Raises:
+        ValueError: If the text is not a valid YYYY-MM-DD date
+    """
+    if not ISO_DATE.fullmatch(value):
+        raise ValueError(f"Date must be in YYYY-MM-DD format: {value!r}")
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid date: {value!r}") from None
+
+
+def to_day(value: str | date) -> Day:
+    """Convert a date to its day number.
+
+    Args:
+        value: Date or YYYY-MM-DD text
+
+    Returns:
+        Day: Days since 1970-01-01
+
+    Raises:
+        ValueError: If the text is not a valid YYYY-MM-DD date
+    """
+    if isinstance(value, str):
+        value = parse_date(value)
+    return Day((value - EPOCH).days)
+
+
+def from_day(day: int) -> str:
+    """Convert a day number to YYYY-MM-DD text.
+
+    Args:
+        day: Days since 1970-01-01
+
+    Returns:
+        str: Date in YYYY-MM-DD format
+    """
+    return (EPOCH + timedelta(days=day)).isoformat()
+
+
+def days_to_dates(days: "np.ndarray") -> "np.ndarray":
+    """Vectorized day number to datetime64 conversion for a whole column.
+
+    Day numbers share the datetime64[D] epoch, so this is a reinterpretation
+    of the integers rather than a conversion of each value.
+
+    Args:
+        days: Integer array of day numbers
+
+    Returns:
+        np.ndarray: datetime64[D] array
+    """
+    return days.astype("datetime64[D]")
+
+
+def dates_to_days(dates: "np.ndarray") -> "np.ndarray":
+    """Vectorized to_day for a whole column of datetime64 values.
+
+    Args:
+        dates: datetime64 array (any unit, truncated to days)
+
+    Returns:
+        np.ndarray: int64 array of day numbers
+    """
+    return dates.astype("datetime64[D]").astype("int64")
@@ -0,0 +1,107 @@
+import math
+from decimal import ROUND_HALF_UP, Decimal
+from typing import TYPE_CHECKING, NewType
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Amounts are stored as integer minor units (cents) so sums are exact
+Cents = NewType("Cents", int)
+
+CENTS_PER_UNIT = 100
+
+# Largest absolute amount accepted, in cents (100 billion units). Far
+# inside SQLite's 64-bit integers, so sums of many amounts cannot
+# overflow, and exactly representable as a float.
+MAX_CENTS = 10**13
+
+
+def to_cents(amount: float | int | str | Decimal) -> Cents:
+    """Convert an amount in currency units to integer cents.
+
+    Strings and Decimals are converted exactly (rounding half up). Floats
+    are rounded to the nearest cent, which is exact for any amount with at
+    most two decimal places.
+
+    Args:
+        amount: Amount in currency units, e.g. 12.34 or "12.34"
+
+    Returns:
+        Cents: Amount in cents, e.g. 1234
+
+    Raises:
+        ValueError: If the amount is not a finite number, or is larger
+            than MAX_CENTS
+    """
+    if isinstance(amount, float):
+        if not math.isfinite(amount):
+            raise ValueError(f"Invalid amount: {amount!r}")
+        try:
+            cents = round(amount * CENTS_PER_UNIT)
+        except OverflowError:
+            # Finite, but too large to scale to cents, e.g. 1e308
+            raise ValueError(f"Amount out of range: {amount!r}") from None
+    elif isinstance(amount, int):
+        cents = amount * CENTS_PER_UNIT
+    else:
+        try:
+            value = Decimal(amount) * CENTS_PER_UNIT
+        except ArithmeticError:
+            raise ValueError(f"Invalid amount: {amount!r}") from None
+        if not value.is_finite():
+            raise ValueError(f"Invalid amount: {amount!r}")
+        cents = int(value.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+    if abs(cents) > MAX_CENTS:
+        raise ValueError(f"Amount out of range: {amount!r}")
+    return Cents(cents)
+
+
+def from_cents(cents: int) -> float:
+    """Convert integer cents to an amount in currency units.
+
+    Args:
+        cents: Amount in cents
+
+    Returns:
+        float: Amount in currency units
+    """
+    return cents / CENTS_PER_UNIT
+
+
+def cents_to_amounts(cents: "np.ndarray") -> "np.ndarray":
+    """Vectorized from_cents for a whole column of cents.
+
+    Args:
+        cents: Integer array of cents
+
+    Returns:
+        np.ndarray: float64 array of amounts in currency units
+    """
+    return cents / CENTS_PER_UNIT
+
+
+def amounts_to_cents(amounts: "np.ndarray") -> "np.ndarray":
+    """Vectorized to_cents for a whole column of float amounts.
+
+    Rounds to the nearest cent, half to even, like `to_cents` does for a
+    float.
+
+    Args:
+        amounts: float64 array of amounts in currency units
+
+    Returns:
+        np.ndarray: int64 array of cents
+
+    Raises:
+        ValueError: If an amount is not finite, or is larger than MAX_CENTS
+    """
+    import numpy as np
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        cents = (amounts * CENTS_PER_UNIT).round()
+        # Casting inf, nan or values beyond int64 would not fail but wrap
+        out_of_range = ~(np.abs(cents) <= MAX_CENTS)
+    if out_of_range.any():
+        amount = float(amounts[np.argmax(out_of_range)])
+        to_cents(amount)  # Raises the message of the first invalid amount
+    return cents.astype("int64")
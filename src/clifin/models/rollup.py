@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class RollupMismatch:
+    """A transaction_rollups entry that disagrees with the transactions table.
+
+    Expected values are aggregated from transactions, actual values are
+    read from the rollup table. None means the entry is missing on that side.
+    """
+
+    month: str
+    category: str
+    sign: int
+    expected_total: float | None
+    expected_count: int | None
+    actual_total: float | None
+    actual_count: int | None
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
 import sqlite3
 
 
@@ -53,8 +54,39 @@ class TransactionUpdate:
 
 
 @dataclass
+class TransactionFilter:
+    """Represents conditions selecting transactions.
+
+    All fields are optional - only non-None fields are applied, and a
+    transaction must match all of them. Filters are compiled to a single
+    parameterized WHERE clause, so they are evaluated by SQLite.
+    """
+
+    start_date: str | None = None  # YYYY-MM-DD, inclusive
+    end_date: str | None = None  # YYYY-MM-DD, inclusive
+    categories: Sequence[str] | None = None  # Any of these categories
+    min_amount: float | None = None  # Absolute value, inclusive
+    max_amount: float | None = None  # Absolute value, inclusive
+    sign: int | None = None  # -1 for expenses only, 1 for revenues only
+    text: str | None = None  # Words searched in title and description
+
+    def has_filters(self) -> bool:
+        """Check if any condition is set.
+
+        Returns:
+            bool: True if at least one field is not None
+        """
+        return any(getattr(self, field.name) is not None for field in fields(self))
+
+
+@dataclass(slots=True)
 class Transaction:
-    """Represents a financial transaction (revenue or expense)."""
+    """Represents a financial transaction (revenue or expense).
+
+    Slotted to keep per-instance memory low when loading large histories.
+    Field order matches TRANSACTION_COLUMNS, so a row selected with those
+    columns can be unpacked positionally: Transaction(*row).
+    """
 
     id: int | None
     title: str
@@ -91,3 +123,20 @@ class Transaction:
             description=row["description"],
             created_at=row["created_at"],
         )
+
+    @staticmethod
+    def row_factory(cursor: sqlite3.Cursor, row: tuple) -> "Transaction":
+        """sqlite3 row factory decoding rows positionally into Transactions.
+
+        Much cheaper than building a sqlite3.Row and looking up each column
+        by name. The query must select TRANSACTION_COLUMNS, in order.
+
+        Example:
+            cursor.row_factory = Transaction.row_factory
+            cursor.execute(f"SELECT {', '.join(TRANSACTION_COLUMNS)} FROM transactions")
+        """
+        return Transaction(*row)
+
+
+# Column order expected by Transaction.row_factory
+TRANSACTION_COLUMNS = tuple(field.name for field in fields(Transaction))
@@ -1,3 +1,19 @@
+from .buffered_writer import BufferedTransactionWriter
+from .category_repository import CategoryRepository
 from .transaction_repository import TransactionRepository
 
-__all__ = ["TransactionRepository"]
+__all__ = [
+    "AsyncTransactionRepository",
+    "BufferedTransactionWriter",
+    "CategoryRepository",
+    "TransactionRepository",
+]
+
+
+def __getattr__(name: str):
+    # Imported on first use: asyncio would slow down every CLI start
+    if name == "AsyncTransactionRepository":
+        from .async_transaction_repository import AsyncTransactionRepository
+
+        return AsyncTransactionRepository
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
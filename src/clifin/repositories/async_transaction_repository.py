@@ -0,0 +1,194 @@
+import asyncio
+import contextlib
+import functools
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar
+
+from ..db.database import get_pool
+from ..models.transaction import Transaction, TransactionFilter
+from .transaction_repository import DEFAULT_CHUNK_SIZE, TransactionRepository
+
+if TYPE_CHECKING:
+    import numpy as np
+
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+# Returned by next() on an exhausted iterator, since StopIteration cannot
+# be raised through a future
+_DONE = object()
+
+
+def _awaitable(
+    method: Callable[Concatenate[TransactionRepository, P], R],
+) -> Callable[Concatenate["AsyncTransactionRepository", P], Coroutine[Any, Any, R]]:
+    """Expose a TransactionRepository method as a coroutine method."""
+
+    @functools.wraps(method)
+    async def wrapper(
+        self: "AsyncTransactionRepository", *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        return await self.run(method, self.repository, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncTransactionRepository:
+    """asyncio counterpart of TransactionRepository.
+
+    Every method of TransactionRepository is available under the same name
+    as a coroutine, and the streaming iterators as async iterators. The
+    SQLite work runs on a dedicated thread executor, so the event loop is
+    never blocked and several reads can run at once:
+
+        async with AsyncTransactionRepository() as repo:
+            page, balance = await asyncio.gather(
+                repo.get_page(20), repo.get_total_balance()
+            )
+
+    The executor has as many threads as the connection pool keeps idle
+    connections, so at most that many calls run at once and each of them
+    borrows an already open connection. Calls beyond that wait in the
+    executor's queue instead of opening more connections. An async
+    iterator holds its connection between chunks, like the synchronous
+    iterators do.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        repository: TransactionRepository | None = None,
+    ):
+        """Create the repository and its executor.
+
+        Args:
+            max_workers: Maximum concurrent SQLite calls, the connection
+                pool size by default
+            repository: Synchronous repository to run, a pooled
+                TransactionRepository by default
+        """
+        self.repository = repository or TransactionRepository()
+        self.max_workers = max_workers or max(get_pool().size, 1)
+        self._executor = ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="clifin-db"
+        )
+
+    async def __aenter__(self) -> "AsyncTransactionRepository":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Wait for running calls to finish and stop the executor threads."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+
+    async def run(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run a blocking function on the repository's executor.
+
+        Use it for database work without a wrapper here, e.g. a
+        CategoryRepository call.
+
+        Args:
+            func: Function to run
+            *args: Positional arguments of func
+            **kwargs: Keyword arguments of func
+
+        Returns:
+            Result of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _iterate(self, iterator: Iterator[T]) -> AsyncIterator[T]:
+        """Advance a blocking iterator on the executor, one item per hop."""
+        try:
+            while (item := await self.run(next, iterator, _DONE)) is not _DONE:
+                yield item  # pyright: ignore[reportReturnType]
+        finally:
+            # Return the iterator's connection to the pool right away
+            await self.run(iterator.close)  # pyright: ignore[reportAttributeAccessIssue]
+
+    create = _awaitable(TransactionRepository.create)
+    create_many = _awaitable(TransactionRepository.create_many)
+    create_arrays = _awaitable(TransactionRepository.create_arrays)
+    get_by_id = _awaitable(TransactionRepository.get_by_id)
+    get_all = _awaitable(TransactionRepository.get_all)
+    fetch_frame = _awaitable(TransactionRepository.fetch_frame)
+    get_change_token = _awaitable(TransactionRepository.get_change_token)
+    get_page = _awaitable(TransactionRepository.get_page)
+    search = _awaitable(TransactionRepository.search)
+    update = _awaitable(TransactionRepository.update)
+    delete = _awaitable(TransactionRepository.delete)
+    update_returning = _awaitable(TransactionRepository.update_returning)
+    delete_returning = _awaitable(TransactionRepository.delete_returning)
+    update_many = _awaitable(TransactionRepository.update_many)
+    delete_many = _awaitable(TransactionRepository.delete_many)
+    get_total_balance = _awaitable(TransactionRepository.get_total_balance)
+    get_balance_by_category = _awaitable(TransactionRepository.get_balance_by_category)
+    get_balance_by_month = _awaitable(TransactionRepository.get_balance_by_month)
+    rebuild_rollups = _awaitable(TransactionRepository.rebuild_rollups)
+    check_rollups = _awaitable(TransactionRepository.check_rollups)
+    get_transactions_by_date_range = _awaitable(
+        TransactionRepository.get_transactions_by_date_range
+    )
+
+    def iter_chunks(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[list[Transaction]]:
+        """Stream transactions in chunks, newest first.
+
+        See `TransactionRepository.iter_chunks`. Each chunk is fetched on
+        the executor, so the event loop only waits once per chunk.
+        """
+        return self._iterate(
+            self.repository.iter_chunks(start_date, end_date, chunk_size)
+        )
+
+    async def iter_all(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[Transaction]:
+        """Stream all transactions with bounded memory.
+
+        See `TransactionRepository.iter_all`.
+        """
+        async with contextlib.aclosing(
+            self.iter_chunks(chunk_size=chunk_size)
+        ) as chunks:
+            async for chunk in chunks:
+                for transaction in chunk:
+                    yield transaction
+
+    async def iter_range(
+        self, start_date: str, end_date: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[Transaction]:
+        """Stream transactions within a date range with bounded memory.
+
+        See `TransactionRepository.iter_range`.
+        """
+        chunks = self.iter_chunks(start_date, end_date, chunk_size)
+        async with contextlib.aclosing(chunks):
+            async for chunk in chunks:
+                for transaction in chunk:
+                    yield transaction
+
+    def iter_arrays(
+        self,
+        filters: TransactionFilter | None = None,
+        since_id: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE * 10,
+    ) -> AsyncIterator[dict[str, "np.ndarray"]]:
+        """Stream transactions as NumPy column arrays, newest first.
+
+        See `TransactionRepository.iter_arrays`.
+        """
+        return self._iterate(self.repository.iter_arrays(filters, since_id, chunk_size))
@@ -0,0 +1,218 @@
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from ..models.day import to_day
+from ..models.money import to_cents
+from ..models.transaction import Transaction
+
+if TYPE_CHECKING:
+    from .transaction_repository import TransactionRepository
+
+# Defaults of TransactionRepository.buffered_writer
+DEFAULT_MAX_ROWS = 1000
+DEFAULT_MAX_DELAY = 1.0  # seconds
+
+
+class BufferedTransactionWriter:
+    """Write-behind buffer grouping many creates into one commit.
+
+    `add` only validates the transaction and appends it to an in-memory
+    buffer. The buffer is written with `TransactionRepository.create_many`
+    as a single transaction (group commit) when a transaction is added to
+    a buffer holding `max_rows` transactions, when its oldest transaction
+    has waited `max_delay` seconds, and on `flush` or `close`. A producer
+    calling `add` in a loop therefore pays one commit per batch instead
+    of one per row:
+
+        with repo.buffered_writer() as writer:
+            for transaction in feed:
+                writer.add(transaction)
+
+    Durability:
+        - Buffered transactions are only in memory: they are lost if the
+          process dies before they are flushed. At most `max_rows`
+          transactions, buffered for at most about `max_delay` seconds,
+          are at risk.
+        - Once `flush` returns, its transactions are committed and as
+          durable as the connection's `synchronous` setting makes them
+          (see CLIFIN_DB_PROFILE): with the default `performance` profile
+          they survive a crash of the application but the last commits
+          may be lost on power failure; with `durable` they survive both.
+        - Batches are atomic: a batch is written completely or not at all.
+        - Buffered transactions are not visible to readers, nor ids
+          assigned, until they are flushed.
+
+    When a flush fails with a transient error (sqlite3.OperationalError,
+    e.g. the database is locked), its transactions are put back at the
+    front of the buffer to be retried by the next flush. Any other error
+    drops the batch, which would fail again. Either way the error is
+    raised by that flush or, for a background flush, by the next `add`,
+    `flush` or `close`. `add` raises before buffering the transaction, so
+    a transaction that made `add` raise is never written.
+
+    The writer is thread-safe; batches are written in the order they were
+    added by one producer.
+    """
+
+    def __init__(
+        self,
+        repository: "TransactionRepository",
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_delay: float | None = DEFAULT_MAX_DELAY,
+    ):
+        """Create a writer and start its background flush thread.
+
+        Args:
+            repository: Repository the batches are written with
+            max_rows: Flush when this many transactions are buffered
+            max_delay: Flush when the oldest buffered transaction is this
+                many seconds old. None disables time based flushes.
+
+        Raises:
+            ValueError: If max_rows or max_delay is not positive
+        """
+        if max_rows <= 0:
+            raise ValueError("max_rows must be a positive number")
+        if max_delay is not None and max_delay <= 0:
+            raise ValueError("max_delay must be a positive number")
+
+        self.repository = repository
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.written = 0
+
+        self._pending: list[Transaction] = []
+        self._oldest: float | None = None  # monotonic time of first pending
+        self._error: Exception | None = None
+        self._closed = False
+        # Guards the buffer; _write_lock serializes the batches so they
+        # are committed in order
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+
+        self._thread = None
+        if max_delay is not None:
+            self._thread = threading.Thread(
+                target=self._flush_on_delay, name="clifin-writer", daemon=True
+            )
+            self._thread.start()
+
+    def __enter__(self) -> "BufferedTransactionWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered transactions not written yet."""
+        with self._lock:
+            return len(self._pending)
+
+    def _raise_error(self) -> None:
+        # Called with _lock held
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def add(self, transaction: Transaction) -> None:
+        """Buffer a transaction, first flushing the buffer if it is full.
+
+        Args:
+            transaction: Transaction to insert
+
+        Raises:
+            ValueError: If the writer is closed, or the transaction's
+                amount or date is invalid
+            RuntimeError: If flushing the full buffer, or a previous
+                background flush, failed
+        """
+        # Rejected here, rather than failing the whole batch at flush time
+        to_cents(transaction.amount)
+        to_day(transaction.date)
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise ValueError("Cannot add to a closed writer")
+                self._raise_error()
+                if len(self._pending) < self.max_rows:
+                    self._pending.append(transaction)
+                    if self._oldest is None:
+                        self._oldest = time.monotonic()
+                        self._wakeup.notify()
+                    return
+            # Flushing in the producer's thread also throttles producers
+            # faster than the database
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered transactions as one committed batch.
+
+        Returns:
+            int: Number of transactions written
+
+        Raises:
+            RuntimeError: If database operation fails, or a previous
+                background flush failed
+        """
+        with self._write_lock:
+            with self._lock:
+                self._raise_error()
+                batch, self._pending = self._pending, []
+                self._oldest = None
+            if not batch:
+                return 0
+            try:
+                written = self.repository.create_many(batch, batch_size=len(batch))
+            except RuntimeError as e:
+                if isinstance(e.__cause__, sqlite3.OperationalError):
+                    with self._lock:
+                        # Keep the batch, and the order, for the next flush
+                        self._pending[:0] = batch
+                        self._oldest = time.monotonic()
+                raise
+            self.written += written
+            return written
+
+    def close(self) -> None:
+        """Flush the buffer and stop the background flush thread.
+
+        Can be called again to retry a failed final flush.
+
+        Raises:
+            RuntimeError: If the final flush, or a previous background
+                flush, failed
+        """
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _flush_on_delay(self) -> None:
+        """Background thread flushing buffers older than max_delay."""
+        assert self.max_delay is not None
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if self._oldest is None:
+                        self._wakeup.wait()
+                        continue
+                    remaining = self._oldest + self.max_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.wait(remaining)
+                if self._closed:
+                    # close() writes what is left in the caller's thread
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                with self._lock:
+                    self._error = e
+                    # Retry after another max_delay instead of spinning
+                    self._oldest = time.monotonic()
@@ -0,0 +1,243 @@
+import sqlite3
+import threading
+from collections.abc import Iterable
+
+from ..db.database import get_connection
+from ..models.category import Category
+
+
+class CategoryCache:
+    """In-process cache of category name -> id.
+
+    Shared by every repository in the process. Entries are validated against
+    the category_edits counter, which triggers bump whenever a category is
+    renamed, merged or deleted, so changes made by other processes are
+    noticed with a single lookup per call instead of one per name.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: dict[str, int] = {}
+        self._version: int | None = None
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._ids.clear()
+            self._version = None
+
+    def resolve(
+        self,
+        conn: sqlite3.Connection,
+        names: Iterable[str],
+        create: bool = False,
+        commit: bool = True,
+    ) -> dict[str, int]:
+        """Get the ids of categories by name.
+
+        Args:
+            conn: Connection to read (and write) categories with
+            names: Category names, duplicates allowed
+            create: Insert categories that do not exist yet. New categories
+                are committed right away, so cached ids always refer to
+                stored rows; call this before writing transactions.
+            commit: With `create`, pass False to leave new categories in
+                the caller's open transaction instead, to be committed or
+                rolled back with its writes. Their ids are then not cached.
+
+        Returns:
+            dict: Name -> id, without unknown names unless `create` is set
+        """
+        wanted = set(names)
+        version = conn.execute(
+            "SELECT value FROM change_counters WHERE name = 'category_edits'"
+        ).fetchone()[0]
+        with self._lock:
+            if version != self._version:
+                self._ids.clear()
+                self._version = version
+            ids = {name: self._ids[name] for name in wanted if name in self._ids}
+
+        missing = [name for name in wanted if name not in ids]
+        if not missing:
+            return ids
+
+        if create:
+            conn.executemany(
+                "INSERT OR IGNORE INTO categories (name) VALUES (?)",
+                [(name,) for name in missing],
+            )
+            if commit:
+                conn.commit()
+        placeholders = ", ".join("?" for _ in missing)
+        found = {
+            row["name"]: row["id"]
+            for row in conn.execute(
+                f"SELECT id, name FROM categories WHERE name IN ({placeholders})",
+                missing,
+            )
+        }
+        with self._lock:
+            # Ids of uncommitted categories would outlive a rollback
+            if self._version == version and (commit or not create):
+                self._ids.update(found)
+        ids.update(found)
+        return ids
+
+
+# Shared by every CategoryRepository in the process
+_cache = CategoryCache()
+
+
+class CategoryRepository:
+    """Repository for managing transaction categories."""
+
+    def __init__(self, pooled: bool = True):
+        """Create a repository.
+
+        Args:
+            pooled: Reuse connections from the shared connection pool.
+                Pass False to open a dedicated connection per call.
+        """
+        self.pooled = pooled
+
+    def resolve(
+        self,
+        conn: sqlite3.Connection,
+        names: Iterable[str],
+        create: bool = False,
+        commit: bool = True,
+    ) -> dict[str, int]:
+        """Get category ids by name through the in-process cache.
+
+        Meant for other repositories, which pass the connection they are
+        writing with. See `CategoryCache.resolve`.
+
+        Args:
+            conn: Connection to read (and write) categories with
+            names: Category names, duplicates allowed
+            create: Insert categories that do not exist yet
+            commit: Commit new categories right away
+
+        Returns:
+            dict: Name -> id
+        """
+        return _cache.resolve(conn, names, create, commit)
+
+    def get_all(self) -> list[Category]:
+        """Get all categories with their number of transactions.
+
+        Counts are read from the transaction_rollups table.
+
+        Returns:
+            List of categories ordered by name
+        """
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            _ = cursor.execute(
+                """
+                SELECT c.id, c.name, COALESCE(SUM(r.count), 0)
+                FROM categories c
+                LEFT JOIN transaction_rollups r ON r.category_id = c.id
+                GROUP BY c.id
+                ORDER BY c.name
+                """
+            )
+            return [Category(*tuple(row)) for row in cursor.fetchall()]
+
+    def get_by_name(self, name: str) -> Category | None:
+        """Get a category by name.
+
+        Args:
+            name: Category name
+
+        Returns:
+            Category if found, None otherwise
+        """
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            _ = cursor.execute(
+                """
+                SELECT c.id, c.name,
+                    (SELECT COALESCE(SUM(count), 0) FROM transaction_rollups
+                     WHERE category_id = c.id)
+                FROM categories c
+                WHERE c.name = ?
+                """,
+                (name,),
+            )
+            row = cursor.fetchone()
+            return Category(*tuple(row)) if row else None
+
+    def rename(self, name: str, new_name: str) -> Category:
+        """Rename a category.
+
+        Transactions reference the category by id, so this updates a
+        single row whatever the number of transactions.
+
+        Args:
+            name: Current category name
+            new_name: New category name
+
+        Returns:
+            Category: The renamed category
+
+        Raises:
+            ValueError: If the category does not exist or new_name is taken
+        """
+        category = self.get_by_name(name)
+        if category is None:
+            raise ValueError(f"Category {name!r} not found")
+        if self.get_by_name(new_name) is not None:
+            raise ValueError(
+                f"Category {new_name!r} already exists, merge the categories instead"
+            )
+
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            _ = cursor.execute(
+                "UPDATE categories SET name = ? WHERE id = ?", (new_name, category.id)
+            )
+            conn.commit()
+        _cache.clear()
+        category.name = new_name
+        return category
+
+    def merge(self, source: str, target: str) -> int:
+        """Move every transaction of one category into another.
+
+        The source category is deleted afterwards. Rollups are kept up to
+        date by the transactions triggers.
+
+        Args:
+            source: Name of the category to merge and delete
+            target: Name of the category receiving the transactions
+
+        Returns:
+            int: Number of transactions moved
+
+        Raises:
+            ValueError: If a category does not exist or both are the same
+        """
+        if source == target:
+            raise ValueError("Cannot merge a category into itself")
+        source_category = self.get_by_name(source)
+        if source_category is None:
+            raise ValueError(f"Category {source!r} not found")
+        target_category = self.get_by_name(target)
+        if target_category is None:
+            raise ValueError(f"Category {target!r} not found")
+
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            _ = cursor.execute(
+                "UPDATE transactions SET category_id = ? WHERE category_id = ?",
+                (target_category.id, source_category.id),
+            )
+            moved = cursor.rowcount
+            _ = cursor.execute(
+                "DELETE FROM categories WHERE id = ?", (source_category.id,)
+            )
+            conn.commit()
+        _cache.clear()
+        return moved
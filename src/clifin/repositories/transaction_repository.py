@@ -1,10 +1,257 @@
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import batched
+from typing import TYPE_CHECKING
+
 from ..db.database import get_connection
-from ..models.transaction import Transaction, TransactionUpdate
+from ..models.change_token import ChangeToken
+from ..models.day import days_to_dates, to_day
+from ..models.money import cents_to_amounts, from_cents, to_cents
+from ..models.rollup import RollupMismatch
+from ..models.transaction import (
+    TRANSACTION_COLUMNS,
+    Transaction,
+    TransactionFilter,
+    TransactionUpdate,
+)
+from .buffered_writer import (
+    DEFAULT_MAX_DELAY,
+    DEFAULT_MAX_ROWS,
+    BufferedTransactionWriter,
+)
+from .category_repository import CategoryRepository
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Rows fetched per round trip by the streaming iterators
+DEFAULT_CHUNK_SIZE = 1000
+
+# Amounts are stored as integer cents in amount_cents and exposed in
+# currency units on Transaction, converted by SQLite while reading.
+# Categories are stored by id and read back by name with a primary key
+# lookup into the categories table. Dates are stored as integer day
+# numbers in `day`; `date` is a virtual column rendering them as text.
+_COLUMN_EXPRESSIONS = {
+    "amount": "amount_cents / 100.0 AS amount",
+    "category": "(SELECT name FROM categories WHERE id = category_id) AS category",
+}
+
+# Explicit column list so rows can be decoded positionally by
+# Transaction.row_factory instead of through sqlite3.Row lookups
+_COLUMNS = ", ".join(_COLUMN_EXPRESSIONS.get(c, c) for c in TRANSACTION_COLUMNS)
+
+# Columns read by iter_arrays and their NumPy dtypes. Amounts are read
+# as exact integer cents and converted to units in one vectorized step,
+# category ids are mapped to names the same way, and day numbers are
+# reinterpreted as datetime64 without parsing any text.
+_FRAME_DTYPES = {
+    "id": "int64",
+    "title": "object",
+    "amount_cents": "int64",
+    "category_id": "int64",
+    "day": "int64",
+    "description": "object",
+    "created_at": "datetime64[s]",
+}
+_FRAME_COLUMNS = ", ".join(_FRAME_DTYPES)
+
+
+# Aggregates of transactions per (month, category_id, sign), as kept in
+# transaction_rollups by the triggers of migration d3b8f1a6c2e4
+_ROLLUP_AGGREGATE = """
+    SELECT
+        strftime('%Y-%m', day * 86400, 'unixepoch') AS month,
+        category_id,
+        CASE WHEN amount_cents < 0 THEN -1 ELSE 1 END AS sign,
+        SUM(amount_cents) AS total_cents,
+        COUNT(*) AS count
+    FROM transactions
+    GROUP BY 1, 2, 3
+"""
+
+
+def _update_columns(updates: TransactionUpdate) -> dict[str, str | int]:
+    """Map the fields of a TransactionUpdate to transactions columns.
+
+    The category is left out: its name must be resolved to a category_id
+    by the caller.
+    """
+    columns: dict[str, str | int] = {}
+    for field, value in updates.to_dict().items():
+        if field == "amount":
+            columns["amount_cents"] = to_cents(value)
+        elif field == "date":
+            columns["day"] = to_day(str(value))
+        elif field != "category":
+            columns[field] = value
+    return columns
+
+
+def _match_expression(query: str) -> str:
+    """Turn free text into an FTS5 MATCH expression.
+
+    Every word is quoted, so characters such as '-' or ':' are searched for
+    instead of being parsed as FTS5 operators, and matched as a prefix.
+    All words must match.
+
+    Raises:
+        ValueError: If the query has no words
+    """
+    words = query.split()
+    if not words:
+        raise ValueError("Search query cannot be empty")
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+
+
+def _filter_conditions(
+    filters: TransactionFilter | None = None,
+    category_ids: Sequence[int] | None = None,
+    since_id: int | None = None,
+) -> tuple[list[str], list[str | int]]:
+    """Compile a TransactionFilter to SQL conditions.
+
+    Args:
+        filters: Conditions to compile
+        category_ids: IDs of `filters.categories`, resolved by the caller
+        since_id: Only match transactions with a greater ID
+
+    Returns:
+        tuple: (conditions, parameters); conditions are meant to be joined
+            with AND, see `_where`
+
+    Raises:
+        ValueError: If a date, amount, sign or text condition is invalid
+    """
+    conditions: list[str] = []
+    params: list[str | int] = []
+    if since_id is not None:
+        conditions.append("id > ?")
+        params.append(since_id)
+    if filters is None:
+        return conditions, params
+
+    if filters.start_date is not None:
+        conditions.append("day >= ?")
+        params.append(to_day(filters.start_date))
+    if filters.end_date is not None:
+        conditions.append("day <= ?")
+        params.append(to_day(filters.end_date))
+    if category_ids is not None:
+        placeholders = ", ".join("?" for _ in category_ids)
+        conditions.append(f"category_id IN ({placeholders})")
+        params.extend(category_ids)
+
+    if filters.sign not in (None, -1, 1):
+        raise ValueError("sign must be -1 (expenses) or 1 (revenues)")
+    low = None if filters.min_amount is None else to_cents(filters.min_amount)
+    high = None if filters.max_amount is None else to_cents(filters.max_amount)
+    if (low is not None and low < 0) or (high is not None and high < 0):
+        raise ValueError("Amount limits are absolute values and cannot be negative")
+    if low is not None and high is not None and low > high:
+        raise ValueError("Minimum amount cannot be greater than maximum amount")
+    if filters.sign is not None or low is not None or high is not None:
+        # Amount limits apply to absolute values. Each sign is compiled to
+        # its own range of amount_cents, so no ABS() hides the column.
+        sides: list[str] = []
+        for sign in (filters.sign,) if filters.sign else (1, -1):
+            side = ["amount_cents > 0" if sign > 0 else "amount_cents < 0"]
+            if low is not None:
+                side.append("amount_cents >= ?" if sign > 0 else "amount_cents <= ?")
+                params.append(sign * low)
+            if high is not None:
+                side.append("amount_cents <= ?" if sign > 0 else "amount_cents >= ?")
+                params.append(sign * high)
+            sides.append(" AND ".join(side))
+        conditions.append("(" + " OR ".join(f"({side})" for side in sides) + ")")
+
+    if filters.text is not None:
+        conditions.append(
+            "id IN (SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH ?)"
+        )
+        params.append(_match_expression(filters.text))
+
+    return conditions, params
+
+
+def _where(conditions: list[str]) -> str:
+    """Join conditions into a WHERE clause, empty without conditions."""
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
 
 class TransactionRepository:
     """Repository for managing financial transactions in the database."""
 
+    def __init__(self, pooled: bool = True):
+        """Create a repository.
+
+        Args:
+            pooled: Reuse connections from the shared connection pool.
+                Pass False to open a dedicated connection per call.
+        """
+        self.pooled = pooled
+        self.categories = CategoryRepository(pooled)
+
+    def _filter_conditions(
+        self,
+        conn: sqlite3.Connection,
+        filters: TransactionFilter | None,
+        since_id: int | None = None,
+    ) -> tuple[list[str], list[str | int]]:
+        """Compile filters to SQL conditions, resolving category names.
+
+        Unknown categories match no transaction.
+        """
+        category_ids = None
+        if filters is not None and filters.categories:
+            category_ids = list(
+                self.categories.resolve(conn, filters.categories).values()
+            )
+        return _filter_conditions(filters, category_ids, since_id)
+
+    def _target_conditions(
+        self,
+        conn: sqlite3.Connection,
+        ids: Iterable[int] | None,
+        filters: TransactionFilter | None,
+    ) -> tuple[list[str], list[str | int]]:
+        """Compile the IDs and filters selecting rows to update or delete.
+
+        IDs are passed as a single JSON array parameter, so any number of
+        them fits in one statement.
+
+        Raises:
+            ValueError: If neither IDs nor filters are given, or a filter
+                is invalid
+        """
+        if ids is None and (filters is None or not filters.has_filters()):
+            raise ValueError("Pass transaction IDs or filters to select transactions")
+
+        conditions, params = self._filter_conditions(conn, filters)
+        if ids is not None:
+            conditions.insert(0, "id IN (SELECT value FROM json_each(?))")
+            params.insert(0, json.dumps([int(i) for i in ids]))
+        return conditions, params
+
+    def _set_columns(
+        self, conn: sqlite3.Connection, updates: TransactionUpdate
+    ) -> dict[str, str | int]:
+        """Map a TransactionUpdate to columns, resolving its category.
+
+        A new category is left uncommitted in the transaction of the
+        UPDATE, which rolls it back when no transaction matched.
+        """
+        # Convert to columns and filter out None values
+        columns = _update_columns(updates)
+        if updates.category is not None:
+            category_ids = self.categories.resolve(
+                conn, [updates.category], create=True, commit=False
+            )
+            columns["category_id"] = category_ids[updates.category]
+        return columns
+
     def create(self, transaction: Transaction) -> int | None:
         """Insert a new transaction.
 
@@ -17,24 +264,159 @@ class TransactionRepository:
         Raises:
             RuntimeError: If database operation fails
         """
-        with get_connection() as conn:
+        with get_connection(self.pooled) as conn:
+            category_ids = self.categories.resolve(
+                conn, [transaction.category], create=True
+            )
             cursor = conn.cursor()
             _ = cursor.execute(
                 """
-                INSERT INTO transactions (title, amount, category, description, date)
+                INSERT INTO transactions
+                    (title, amount_cents, category_id, description, day)
                 VALUES (?, ?, ?, ?, ?)
                 """,
                 (
                     transaction.title,
-                    transaction.amount,
-                    transaction.category,
+                    to_cents(transaction.amount),
+                    category_ids[transaction.category],
                     transaction.description,
-                    transaction.date,
+                    to_day(transaction.date),
                 ),
             )
             conn.commit()
             return cursor.lastrowid
 
+    def create_many(
+        self, transactions: Iterable[Transaction], batch_size: int = 1000
+    ) -> int:
+        """Insert many transactions using batched executemany calls.
+
+        A single connection is used for the whole stream and each batch is
+        committed as one transaction, so large imports avoid the per-row
+        connect and commit cost of `create`. Category names are resolved
+        once per batch.
+
+        Args:
+            transactions: Iterable of transactions to insert (may be a generator)
+            batch_size: Number of rows written per transaction
+
+        Returns:
+            int: Number of inserted transactions
+
+        Raises:
+            ValueError: If batch_size is not positive
+            RuntimeError: If database operation fails
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive number")
+
+        inserted = 0
+        with get_connection(self.pooled) as conn:
+            for batch in batched(transactions, batch_size):
+                category_ids = self.categories.resolve(
+                    conn, (t.category for t in batch), create=True
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO transactions
+                        (title, amount_cents, category_id, description, day)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            t.title,
+                            to_cents(t.amount),
+                            category_ids[t.category],
+                            t.description,
+                            to_day(t.date),
+                        )
+                        for t in batch
+                    ],
+                )
+                conn.commit()
+                inserted += len(batch)
+        return inserted
+
+    def create_arrays(
+        self, arrays: Mapping[str, "np.ndarray"], batch_size: int = 1000
+    ) -> int:
+        """Insert transactions given as NumPy column arrays.
+
+        The columnar counterpart of `create_many`, for callers that already
+        hold validated columns (e.g. `importers.read_column_batches`): no
+        Transaction objects are built and category names are resolved once
+        for the whole arrays. Each batch is committed as one transaction.
+
+        Args:
+            arrays: `title`, `amount_cents`, `category` (name), `day` and
+                `description` (None for no description) arrays of equal
+                length, as yielded by `iter_arrays`
+            batch_size: Number of rows written per transaction
+
+        Returns:
+            int: Number of inserted transactions
+
+        Raises:
+            ValueError: If batch_size is not positive
+            RuntimeError: If database operation fails
+        """
+        import numpy as np
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive number")
+
+        with get_connection(self.pooled) as conn:
+            names, inverse = np.unique(
+                arrays["category"].astype(str), return_inverse=True
+            )
+            category_ids = self.categories.resolve(conn, names.tolist(), create=True)
+            ids = np.array([category_ids[name] for name in names.tolist()], "int64")
+            rows = zip(
+                arrays["title"].tolist(),
+                arrays["amount_cents"].tolist(),
+                ids[inverse].tolist(),
+                arrays["description"].tolist(),
+                arrays["day"].tolist(),
+                strict=True,
+            )
+
+            inserted = 0
+            for batch in batched(rows, batch_size):
+                conn.executemany(
+                    """
+                    INSERT INTO transactions
+                        (title, amount_cents, category_id, description, day)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    batch,
+                )
+                conn.commit()
+                inserted += len(batch)
+        return inserted
+
+    def buffered_writer(
+        self,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_delay: float | None = DEFAULT_MAX_DELAY,
+    ) -> BufferedTransactionWriter:
+        """Create a write-behind writer for high-rate producers.
+
+        Use it instead of calling `create` in a loop: transactions are
+        buffered in memory and inserted in group commits. See
+        `BufferedTransactionWriter` for when buffered transactions are
+        written and how durable they are.
+
+        Args:
+            max_rows: Flush when this many transactions are buffered
+            max_delay: Flush when the oldest buffered transaction is this
+                many seconds old. None only flushes on size and on demand.
+
+        Returns:
+            BufferedTransactionWriter: Writer to `add` transactions to and
+                `close` (or use as a context manager) when done
+        """
+        return BufferedTransactionWriter(self, max_rows, max_delay)
+
     def get_by_id(self, transaction_id: int) -> Transaction | None:
         """Get transaction by ID.
 
@@ -44,13 +426,13 @@ class TransactionRepository:
         Returns:
             Transaction if found, None otherwise
         """
-        with get_connection() as conn:
+        with get_connection(self.pooled) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = Transaction.row_factory
             _ = cursor.execute(
-                "SELECT * FROM transactions WHERE id = ?", (transaction_id,)
+                f"SELECT {_COLUMNS} FROM transactions WHERE id = ?", (transaction_id,)
             )
-            row = cursor.fetchone()
-            return Transaction.from_row(row) if row else None
+            return cursor.fetchone()
 
     def get_all(self) -> list[Transaction]:
         """Get all transactions.
@@ -58,13 +440,340 @@ class TransactionRepository:
         Returns:
             List of all transactions
         """
-        with get_connection() as conn:
+        with get_connection(self.pooled) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = Transaction.row_factory
             _ = cursor.execute(
-                "SELECT * FROM transactions ORDER BY date DESC, created_at DESC"
+                f"SELECT {_COLUMNS} FROM transactions ORDER BY day DESC, created_at DESC"
             )
-            rows = cursor.fetchall()
-            return [Transaction.from_row(row) for row in rows]
+            return cursor.fetchall()
+
+    def iter_chunks(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[list[Transaction]]:
+        """Stream transactions in chunks, newest first.
+
+        Rows are read with `fetchmany`, so at most `chunk_size` transactions
+        are held in memory at once. The connection stays checked out until
+        the iterator is exhausted or closed.
+
+        Args:
+            start_date: Optional start date (YYYY-MM-DD), inclusive
+            end_date: Optional end date (YYYY-MM-DD), inclusive
+            chunk_size: Rows fetched and yielded per chunk
+
+        Yields:
+            list[Transaction]: Next chunk of at most `chunk_size` transactions
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive number")
+
+        conditions, params = _filter_conditions(
+            TransactionFilter(start_date=start_date, end_date=end_date)
+        )
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = Transaction.row_factory
+            cursor.arraysize = chunk_size
+            _ = cursor.execute(
+                f"""
+                SELECT {_COLUMNS} FROM transactions
+                {_where(conditions)}
+                ORDER BY day DESC, created_at DESC
+                """,
+                params,
+            )
+            while chunk := cursor.fetchmany():
+                yield chunk
+
+    def iter_all(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Transaction]:
+        """Stream all transactions with bounded memory.
+
+        Same order as `get_all`, but rows are fetched `chunk_size` at a time
+        instead of being loaded into a single list.
+
+        Args:
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Transaction: Next transaction
+        """
+        for chunk in self.iter_chunks(chunk_size=chunk_size):
+            yield from chunk
+
+    def iter_range(
+        self, start_date: str, end_date: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Transaction]:
+        """Stream transactions within a date range with bounded memory.
+
+        Streaming counterpart of `get_transactions_by_date_range`.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Transaction: Next transaction in the range
+        """
+        for chunk in self.iter_chunks(start_date, end_date, chunk_size):
+            yield from chunk
+
+    def iter_arrays(
+        self,
+        filters: TransactionFilter | None = None,
+        since_id: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE * 10,
+    ) -> Iterator[dict[str, "np.ndarray"]]:
+        """Stream transactions as NumPy column arrays, newest first.
+
+        Rows are read as plain tuples in chunks and transposed straight into
+        one array per stored column (see `_FRAME_DTYPES`), skipping
+        Transaction objects entirely. Each chunk also has a `category`
+        array of names, looked up from `category_id` in one vectorized step.
+        Only one chunk is held in memory at a time.
+
+        Args:
+            filters: Optional conditions rows must match
+            since_id: Only read transactions with a greater ID
+            chunk_size: Rows fetched and yielded per chunk
+
+        Yields:
+            dict[str, np.ndarray]: Column name -> array of at most
+                `chunk_size` values
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        # Only analytics callers pay for importing NumPy
+        import numpy as np
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive number")
+
+        with get_connection(self.pooled) as conn:
+            conditions, params = self._filter_conditions(
+                conn, filters or TransactionFilter(), since_id
+            )
+            names = dict(conn.execute("SELECT id, name FROM categories").fetchall())
+
+            # Category id -> name lookup table indexed by id
+            lookup = np.empty(max(names, default=0) + 1, dtype=object)
+            lookup[list(names)] = list(names.values())
+
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples
+            cursor.arraysize = chunk_size
+            _ = cursor.execute(
+                f"""
+                SELECT {_FRAME_COLUMNS} FROM transactions
+                {_where(conditions)}
+                ORDER BY day DESC, created_at DESC
+                """,
+                params,
+            )
+            while chunk := cursor.fetchmany():
+                arrays = {
+                    name: np.array(values, dtype=_FRAME_DTYPES[name])
+                    for name, values in zip(_FRAME_DTYPES, zip(*chunk))
+                }
+                arrays["category"] = lookup[arrays["category_id"]]
+                yield arrays
+
+    def fetch_frame(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        categories: Sequence[str] | None = None,
+        since_id: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE * 10,
+    ) -> "pd.DataFrame":
+        """Load transactions into a pandas DataFrame, newest first.
+
+        Built from the column arrays of `iter_arrays`. `date` is returned
+        as datetime64, converted straight from the stored day numbers, and
+        `created_at` as a datetime64 timestamp.
+        Both the exact `amount_cents` (int64) and `amount` in currency units
+        (float64) are included; aggregate on `amount_cents` for exact sums.
+        Likewise `category_id` is included next to the `category` name.
+
+        Args:
+            start_date: Optional start date (YYYY-MM-DD), inclusive
+            end_date: Optional end date (YYYY-MM-DD), inclusive
+            categories: Optional categories to include
+            since_id: Only load transactions with a greater ID, e.g. to
+                append new rows to a frame loaded earlier
+            chunk_size: Rows fetched per round trip
+
+        Returns:
+            pd.DataFrame: One row per transaction with the TRANSACTION_COLUMNS
+                plus amount_cents and category_id
+        """
+        # Only analytics callers pay for importing NumPy and pandas
+        import numpy as np
+        import pandas as pd
+
+        parts: dict[str, list[np.ndarray]] = {
+            name: [] for name in (*_FRAME_DTYPES, "category")
+        }
+        for arrays in self.iter_arrays(
+            TransactionFilter(start_date, end_date, categories), since_id, chunk_size
+        ):
+            for name, values in arrays.items():
+                parts[name].append(values)
+
+        columns = {
+            name: np.concatenate(arrays)
+            if arrays
+            else np.array([], dtype=_FRAME_DTYPES.get(name, "object"))
+            for name, arrays in parts.items()
+        }
+        category = columns.pop("category")
+        frame = pd.DataFrame(columns)
+        frame.insert(2, "amount", cents_to_amounts(frame["amount_cents"].to_numpy()))
+        frame.insert(4, "category", category)
+        frame.insert(6, "date", days_to_dates(frame.pop("day").to_numpy()))
+        return frame
+
+    def get_change_token(self) -> ChangeToken:
+        """Get a cheap fingerprint of the transactions table.
+
+        Uses the rowid maximum, the rollup counts and the edit counter kept
+        by triggers, so it costs a few index lookups whatever the table size.
+
+        Returns:
+            ChangeToken: Current state of the transactions table
+        """
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            _ = cursor.execute(
+                """
+                SELECT
+                    (SELECT COALESCE(MAX(id), 0) FROM transactions) AS max_id,
+                    (SELECT COALESCE(SUM(count), 0) FROM transaction_rollups) AS count,
+                    (SELECT value FROM change_counters
+                     WHERE name = 'transaction_edits') AS edits
+                """
+            )
+            row = cursor.fetchone()
+            return ChangeToken(row["max_id"], row["count"], row["edits"])
+
+    def get_page(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        after_id: int | None = None,
+        before_date: str | None = None,
+        filters: TransactionFilter | None = None,
+    ) -> list[Transaction]:
+        """Get one page of transactions, newest first.
+
+        LIMIT/OFFSET are applied by SQLite, so only the requested rows are
+        read and decoded. For deep pages prefer keyset pagination with
+        `after_id`, which seeks straight to the position in the
+        (day, created_at) index instead of skipping `offset` rows.
+
+        Filters are compiled into the same statement, so pages of filtered
+        transactions are selected by SQLite as well.
+
+        Args:
+            limit: Maximum number of transactions to return
+            offset: Number of matching transactions to skip
+            after_id: Only return transactions listed after this one
+                (typically the last ID of the previous page)
+            before_date: Only return transactions dated before this day (YYYY-MM-DD)
+            filters: Optional conditions transactions must match
+
+        Returns:
+            List of at most `limit` transactions
+
+        Raises:
+            ValueError: If limit or offset is negative, after_id is not the
+                ID of a transaction, or a date or filter is invalid
+        """
+        if limit < 0 or offset < 0:
+            raise ValueError("limit and offset cannot be negative")
+
+        conditions: list[str] = []
+        params: list[int | str] = []
+        if before_date is not None:
+            conditions.append("day < ?")
+            params.append(to_day(before_date))
+
+        with get_connection(self.pooled) as conn:
+            if after_id is not None:
+                cursor_row = conn.execute(
+                    "SELECT day, created_at FROM transactions WHERE id = ?",
+                    (after_id,),
+                ).fetchone()
+                if cursor_row is None:
+                    # Would silently list nothing, as if the listing had ended
+                    raise ValueError(f"Unknown cursor id: {after_id}")
+                # id breaks ties between rows sharing day and created_at
+                conditions.append("(day, created_at, id) < (?, ?, ?)")
+                params.extend([*cursor_row, after_id])
+
+            filter_conditions, filter_params = self._filter_conditions(conn, filters)
+            conditions.extend(filter_conditions)
+            params.extend(filter_params)
+
+            cursor = conn.cursor()
+            cursor.row_factory = Transaction.row_factory
+            _ = cursor.execute(
+                f"""
+                SELECT {_COLUMNS} FROM transactions
+                {_where(conditions)}
+                ORDER BY day DESC, created_at DESC, id DESC
+                LIMIT ? OFFSET ?
+                """,
+                [*params, limit, offset],
+            )
+            return cursor.fetchall()
+
+    def search(self, query: str, limit: int = 20) -> list[Transaction]:
+        """Find transactions whose title or description match a text query.
+
+        Served by the transactions_fts full-text index. Each word of the
+        query matches words starting with it, ignoring case and accents,
+        and all words must match. Results are ranked with BM25, weighting
+        title matches above description matches.
+
+        Args:
+            query: Words to search for, e.g. "uber"
+            limit: Maximum number of transactions to return
+
+        Returns:
+            List of at most `limit` transactions, best match first
+
+        Raises:
+            ValueError: If the query is empty or limit is negative
+        """
+        if limit < 0:
+            raise ValueError("limit cannot be negative")
+
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = Transaction.row_factory
+            _ = cursor.execute(
+                f"""
+                SELECT {_COLUMNS} FROM transactions
+                JOIN (
+                    SELECT rowid, rank FROM transactions_fts
+                    WHERE transactions_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ) AS hits ON hits.rowid = transactions.id
+                ORDER BY hits.rank
+                """,
+                (_match_expression(query), limit),
+            )
+            return cursor.fetchall()
 
     def update(self, transaction_id: int, updates: TransactionUpdate) -> bool:
         """Update transaction fields.
@@ -80,21 +789,23 @@ class TransactionRepository:
             updates = TransactionUpdate(title="New Title", amount=100.0)
             repo.update(transaction_id, updates)
         """
-        # Convert to dict and filter out None values
-        fields_to_update = updates.to_dict()
-
-        if not fields_to_update:
+        if not updates.has_updates():
             return False
 
-        # Build dynamic UPDATE query
-        set_clause = ", ".join(f"{field} = ?" for field in fields_to_update.keys())
-        values = list(fields_to_update.values()) + [transaction_id]
+        with get_connection(self.pooled) as conn:
+            fields_to_update = self._set_columns(conn, updates)
+
+            # Build dynamic UPDATE query
+            set_clause = ", ".join(f"{field} = ?" for field in fields_to_update.keys())
+            values = list(fields_to_update.values()) + [transaction_id]
 
-        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(f"UPDATE transactions SET {set_clause} WHERE id = ?", values)
+            if cursor.rowcount == 0:
+                conn.rollback()
+                return False
             conn.commit()
-            return cursor.rowcount > 0
+            return True
 
     def delete(self, transaction_id: int) -> bool:
         """Delete transaction by ID.
@@ -105,44 +816,270 @@ class TransactionRepository:
         Returns:
             bool: True if deleted, False if not found
         """
-        with get_connection() as conn:
+        with get_connection(self.pooled) as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
             conn.commit()
             return cursor.rowcount > 0
 
+    def update_returning(
+        self, transaction_id: int, updates: TransactionUpdate
+    ) -> Transaction | None:
+        """Update transaction fields and return the updated transaction.
+
+        Uses a single UPDATE ... RETURNING statement on one connection, so
+        callers do not need a separate `get_by_id` to check the transaction
+        exists or to show the result.
+
+        Args:
+            transaction_id: Transaction ID
+            updates: TransactionUpdate object with fields to update
+
+        Returns:
+            Transaction as updated, None if not found or nothing to update
+        """
+        if not updates.has_updates():
+            return None
+
+        with get_connection(self.pooled) as conn:
+            fields_to_update = self._set_columns(conn, updates)
+            set_clause = ", ".join(f"{field} = ?" for field in fields_to_update.keys())
+
+            cursor = conn.cursor()
+            cursor.row_factory = Transaction.row_factory
+            _ = cursor.execute(
+                f"UPDATE transactions SET {set_clause} WHERE id = ? RETURNING {_COLUMNS}",
+                [*fields_to_update.values(), transaction_id],
+            )
+            # Rows must be read before committing the statement
+            rows = cursor.fetchall()
+            if not rows:
+                conn.rollback()
+                return None
+            conn.commit()
+            return rows[0]
+
+    def delete_returning(self, transaction_id: int) -> Transaction | None:
+        """Delete a transaction and return it.
+
+        Uses a single DELETE ... RETURNING statement on one connection, so
+        callers do not need a separate `get_by_id` to check the transaction
+        exists or to show what was deleted.
+
+        Args:
+            transaction_id: Transaction ID
+
+        Returns:
+            The deleted transaction, None if not found
+        """
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = Transaction.row_factory
+            _ = cursor.execute(
+                f"DELETE FROM transactions WHERE id = ? RETURNING {_COLUMNS}",
+                (transaction_id,),
+            )
+            # Rows must be read before committing the statement
+            rows = cursor.fetchall()
+            conn.commit()
+            return rows[0] if rows else None
+
+    def update_many(
+        self,
+        updates: TransactionUpdate,
+        ids: Iterable[int] | None = None,
+        filters: TransactionFilter | None = None,
+    ) -> int:
+        """Update every transaction selected by IDs and/or filters.
+
+        Runs as a single UPDATE statement in one transaction; when both
+        IDs and filters are given, transactions must match both.
+
+        Args:
+            updates: TransactionUpdate object with fields to update
+            ids: IDs of the transactions to update
+            filters: Conditions selecting the transactions to update
+
+        Returns:
+            int: Number of updated transactions
+
+        Raises:
+            ValueError: If neither IDs nor filters are given, or a field or
+                filter is invalid
+        """
+        if not updates.has_updates():
+            return 0
+
+        with get_connection(self.pooled) as conn:
+            conditions, params = self._target_conditions(conn, ids, filters)
+            fields_to_update = self._set_columns(conn, updates)
+            set_clause = ", ".join(f"{field} = ?" for field in fields_to_update.keys())
+
+            cursor = conn.cursor()
+            _ = cursor.execute(
+                f"UPDATE transactions SET {set_clause} {_where(conditions)}",
+                [*fields_to_update.values(), *params],
+            )
+            if cursor.rowcount == 0:
+                conn.rollback()
+                return 0
+            conn.commit()
+            return cursor.rowcount
+
+    def delete_many(
+        self,
+        ids: Iterable[int] | None = None,
+        filters: TransactionFilter | None = None,
+    ) -> int:
+        """Delete every transaction selected by IDs and/or filters.
+
+        Runs as a single DELETE statement in one transaction; when both
+        IDs and filters are given, transactions must match both.
+
+        Args:
+            ids: IDs of the transactions to delete
+            filters: Conditions selecting the transactions to delete
+
+        Returns:
+            int: Number of deleted transactions
+
+        Raises:
+            ValueError: If neither IDs nor filters are given, or a filter
+                is invalid
+        """
+        with get_connection(self.pooled) as conn:
+            conditions, params = self._target_conditions(conn, ids, filters)
+            cursor = conn.cursor()
+            _ = cursor.execute(f"DELETE FROM transactions {_where(conditions)}", params)
+            conn.commit()
+            return cursor.rowcount
+
     def get_total_balance(self) -> float:
         """Calculate total balance (sum of all transactions).
 
+        Read from the transaction_rollups table, so the cost depends on the
+        number of months and categories rather than of transactions.
+
         Returns:
             float: Total balance
         """
-        with get_connection() as conn:
+        with get_connection(self.pooled) as conn:
             cursor = conn.cursor()
             _ = cursor.execute(
-                "SELECT COALESCE(SUM(amount), 0) as total FROM transactions"
+                "SELECT COALESCE(SUM(total_cents), 0) as total FROM transaction_rollups"
             )
             row = cursor.fetchone()
-            return float(row["total"])
+            return from_cents(row["total"])
 
     def get_balance_by_category(self) -> dict[str, float]:
         """Get balance grouped by category.
 
+        Read from the transaction_rollups table, grouped on the integer
+        category_id; names are only looked up for the resulting rows.
+
         Returns:
             dict: Category -> balance mapping
         """
-        with get_connection() as conn:
+        with get_connection(self.pooled) as conn:
             cursor = conn.cursor()
             _ = cursor.execute(
                 """
-                SELECT category, SUM(amount) as total
-                FROM transactions
-                GROUP BY category
+                SELECT
+                    (SELECT name FROM categories WHERE id = category_id) AS category,
+                    total
+                FROM (
+                    SELECT category_id, SUM(total_cents) as total
+                    FROM transaction_rollups
+                    GROUP BY category_id
+                )
                 ORDER BY total DESC
                 """
             )
             rows = cursor.fetchall()
-            return {row["category"]: float(row["total"]) for row in rows}
+            return {row["category"]: from_cents(row["total"]) for row in rows}
+
+    def get_balance_by_month(self) -> dict[str, float]:
+        """Get net balance grouped by month.
+
+        Read from the transaction_rollups table.
+
+        Returns:
+            dict: Month (YYYY-MM) -> balance mapping, oldest first
+        """
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            _ = cursor.execute(
+                """
+                SELECT month, SUM(total_cents) as total
+                FROM transaction_rollups
+                GROUP BY month
+                ORDER BY month
+                """
+            )
+            rows = cursor.fetchall()
+            return {row["month"]: from_cents(row["total"]) for row in rows}
+
+    def rebuild_rollups(self) -> int:
+        """Recompute the transaction_rollups table from scratch.
+
+        Runs in a single transaction, so readers never see a partial table.
+
+        Returns:
+            int: Number of rollup entries written
+        """
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM transaction_rollups")
+            cursor.execute(
+                f"""
+                INSERT INTO transaction_rollups
+                    (month, category_id, sign, total_cents, count)
+                {_ROLLUP_AGGREGATE}
+                """
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def check_rollups(self) -> list[RollupMismatch]:
+        """Compare transaction_rollups against a full aggregation of transactions.
+
+        Returns:
+            list[RollupMismatch]: Inconsistent entries (empty if consistent)
+        """
+        with get_connection(self.pooled) as conn:
+            cursor = conn.cursor()
+            _ = cursor.execute(
+                f"""
+                WITH expected AS ({_ROLLUP_AGGREGATE}),
+                mismatches (
+                    month, category_id, sign,
+                    expected_total, expected_count, actual_total, actual_count
+                ) AS (
+                    SELECT e.month, e.category_id, e.sign,
+                           e.total_cents / 100.0, e.count,
+                           r.total_cents / 100.0, r.count
+                    FROM expected e
+                    LEFT JOIN transaction_rollups r
+                        USING (month, category_id, sign)
+                    WHERE r.count IS NULL
+                       OR r.count != e.count
+                       OR r.total_cents != e.total_cents
+                    UNION ALL
+                    SELECT r.month, r.category_id, r.sign,
+                           NULL, NULL, r.total_cents / 100.0, r.count
+                    FROM transaction_rollups r
+                    LEFT JOIN expected e USING (month, category_id, sign)
+                    WHERE e.count IS NULL
+                )
+                SELECT m.month, COALESCE(c.name, '#' || m.category_id), m.sign,
+                       m.expected_total, m.expected_count,
+                       m.actual_total, m.actual_count
+                FROM mismatches m
+                LEFT JOIN categories c ON c.id = m.category_id
+                ORDER BY 1, 2, 3
+                """
+            )
+            return [RollupMismatch(*tuple(row)) for row in cursor.fetchall()]
 
     def get_transactions_by_date_range(
         self, start_date: str, end_date: str
@@ -156,15 +1093,15 @@ class TransactionRepository:
         Returns:
             List of transactions in date range
         """
-        with get_connection() as conn:
+        with get_connection(self.pooled) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = Transaction.row_factory
             _ = cursor.execute(
-                """
-                SELECT * FROM transactions
-                WHERE date BETWEEN ? AND ?
-                ORDER BY date DESC, created_at DESC
+                f"""
+                SELECT {_COLUMNS} FROM transactions
+                WHERE day BETWEEN ? AND ?
+                ORDER BY day DESC, created_at DESC
                 """,
-                (start_date, end_date),
+                (to_day(start_date), to_day(end_date)),
             )
-            rows = cursor.fetchall()
-            return [Transaction.from_row(row) for row in rows]
+            return cursor.fetchall()
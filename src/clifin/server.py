@@ -0,0 +1,134 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from pathlib import Path
+
+from .client import database_key, owned_by_user
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """Runs the JSON command lines sent by `client.forward`.
+
+    Each request is one line: {"args": [...], "database": ...}. The
+    response line holds the command's stdout, stderr and exit code.
+    """
+
+    server: "CommandServer"
+
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            if request.get("database") != self.server.database:
+                response = {"error": "This server uses another database"}
+            else:
+                response = self.server.run(request["args"])
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class CommandServer(socketserver.UnixStreamServer):
+    """Unix socket server running CLI commands in a warm process.
+
+    The CLI module, its repository, the connection pool and the category
+    cache stay loaded between commands, so a command costs a socket round
+    trip instead of starting Python and importing the stack.
+
+    Commands run one at a time: the output of a command is captured by
+    swapping sys.stdout and sys.stderr, which are shared by the process.
+    """
+
+    def __init__(self, path: Path):
+        # Only the current user may connect: commands can change the data
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(path), _CommandHandler)
+        finally:
+            os.umask(old_umask)
+        self.path = path
+        self.database = database_key()
+
+    def run(self, args: list[str]) -> dict:
+        """Run one command line and capture its output.
+
+        Args:
+            args: Command line arguments, without the program name
+
+        Returns:
+            dict: stdout, stderr and exit_code of the command
+        """
+        from .cli import app
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        with (
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            # No terminal to prompt on: prompts read EOF and abort
+            stdin, sys.stdin = sys.stdin, io.StringIO()
+            try:
+                app(args=args, prog_name="clifin")
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else int(bool(e.code))
+            except Exception:
+                # Report it to the client and keep serving
+                traceback.print_exc()
+                exit_code = 1
+            finally:
+                sys.stdin = stdin
+        return {
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "exit_code": exit_code,
+        }
+
+    def server_close(self):
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def _is_running(path: Path) -> bool:
+    """Check whether a server is accepting connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+        # Close the connection cleanly so the server's handler ends
+        with contextlib.suppress(OSError):
+            sock.shutdown(socket.SHUT_WR)
+        return True
+
+
+def create_server(path: Path) -> CommandServer:
+    """Bind a CommandServer to the socket path.
+
+    A socket file left behind by a server that did not shut down cleanly
+    is replaced.
+
+    Args:
+        path: Socket path
+
+    Returns:
+        CommandServer: Bound server; call `serve_forever` to run it
+
+    Raises:
+        RuntimeError: If a server is already running on the socket, the
+            socket belongs to another user or Unix sockets are not supported
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Unix domain sockets are not supported on this system")
+    if path.exists():
+        if not owned_by_user(path):
+            raise RuntimeError(
+                f"{path} belongs to another user, set CLIFIN_SOCKET to another path"
+            )
+        if _is_running(path):
+            raise RuntimeError(f"A clifin server is already running on {path}")
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return CommandServer(path)